@@ -17,6 +17,10 @@ Usage:
 import os
 import io
 import sys
+import json
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import pandas as pd
@@ -42,11 +46,11 @@ if _parent_dir not in sys.path:
 # Try different import strategies for report_utils
 try:
     # Strategy 1: Package import (works when run as: python -m analysis.analyze_results)
-    from analysis.report_utils import aggregate_latency, plot_latency_distribution, write_summary_md
+    from analysis.report_utils import normalize_dataframe, aggregate_latency, plot_latency_distribution, write_summary_md
 except ImportError:
     try:
         # Strategy 2: Direct import from same directory (works when run as: python analysis/analyze_results.py)
-        from report_utils import aggregate_latency, plot_latency_distribution, write_summary_md
+        from report_utils import normalize_dataframe, aggregate_latency, plot_latency_distribution, write_summary_md
     except ImportError as e:
         error_msg = str(e)
         if "No module named" in error_msg or "cannot import name" in error_msg:
@@ -71,9 +75,61 @@ except ImportError:
             print(f"[INFO] Parent directory: {_parent_dir}")
         sys.exit(1)
 
+# pyarrow is optional: without it downloaded runs are combined in memory
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    _ANALYSIS_SCHEMA = pa.schema([
+        ("run_id", pa.string()),
+        ("strategy", pa.string()),
+        ("node", pa.string()),
+        ("latency", pa.float32()),
+    ])
+except ImportError:
+    pa = None
+    pacsv = None
+    pq = None
+    _ANALYSIS_SCHEMA = None
+
 S3_BUCKET = os.getenv("S3_BUCKET", "latency-results-project")
 REGION = os.getenv("AWS_REGION", "us-east-1")
 DATA_DIR = os.getenv("DATA_DIR", "data")
+S3_MAX_WORKERS = int(os.getenv("S3_MAX_WORKERS", "32"))
+COMBINED_PATH = os.getenv("COMBINED_PATH", os.path.join("analysis", "out", "combined_runs.parquet"))
+CACHE_DIR = os.getenv("ANALYSIS_CACHE_DIR", os.path.join("analysis", ".cache"))
+LISTING_TTL_S = float(os.getenv("S3_LISTING_TTL", "60"))
+
+# Columns written by the experiment scripts and the dtypes they are parsed with.
+# Label columns are categorical so groupby/plotting work on integer codes.
+# Unknown columns are dropped at read time.
+RESULT_DTYPES = {
+    "task_id": "int32",
+    "size_mb": "float32",
+    "latency": "float32",
+    "latency_ms": "float32",
+    "energy": "float64",
+    "strategy": "category",
+    "app_type": "category",
+    "priority": "category",
+    "node": "category",
+}
+RESULT_COLUMNS = set(RESULT_DTYPES)
+# Columns main() actually reads. Every downloaded run, RL-only or
+# multi-strategy, is normalized to exactly these before being combined.
+ANALYSIS_COLUMNS = ["run_id", "strategy", "node", "latency"]
+
+
+def _read_results_csv(source) -> pd.DataFrame:
+    """
+    Parse a workload_results.csv with the fixed RESULT_DTYPES schema.
+    
+    Uses the pyarrow CSV engine when available so no type inference runs.
+    """
+    if pa is None:
+        return pd.read_csv(source, dtype=RESULT_DTYPES, usecols=lambda c: c in RESULT_COLUMNS)
+    df = pd.read_csv(source, engine="pyarrow", dtype=RESULT_DTYPES)
+    return df[[c for c in df.columns if c in RESULT_COLUMNS]]
 
 
 def load_local_results(data_dir: str = DATA_DIR) -> pd.DataFrame:
@@ -93,7 +149,7 @@ def load_local_results(data_dir: str = DATA_DIR) -> pd.DataFrame:
         return pd.DataFrame()
     
     try:
-        df = pd.read_csv(local_file)
+        df = _read_results_csv(local_file)
         df["run_id"] = "local-run"  # Mark as local run
         print(f"[OK] Loaded local file: {local_file} ({len(df)} rows)")
         return df
@@ -102,16 +158,144 @@ def load_local_results(data_dir: str = DATA_DIR) -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def write_results_table(df: pd.DataFrame, csv_path: str) -> None:
+    """
+    Write `df` to `csv_path`, plus a zstd Parquet copy alongside it when pyarrow is available.
+    
+    The pyarrow CSV writer replaces pandas' Python-level one; the Parquet copy
+    lets later reruns skip CSV parsing.
+    """
+    if pa is None:
+        df.to_csv(csv_path, index=False)
+        return
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Spelled out so the quoting does not depend on pyarrow's default;
+    # "needed" quotes strings but leaves numbers bare
+    pacsv.write_csv(table, csv_path, pacsv.WriteOptions(quoting_style="needed"))
+    pq.write_table(table, os.path.splitext(csv_path)[0] + ".parquet", compression="zstd")
+
+
+def _load_json(path: str, default):
+    """Read a JSON cache file, returning `default` if it is missing or corrupt."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def _save_json(path: str, data) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def _list_result_objects(paginator, prefix: str) -> list:
+    """
+    List workload_results.csv objects under `prefix` as {Key, ETag, Size} dicts.
+    
+    The listing is cached in CACHE_DIR for LISTING_TTL_S seconds so quick
+    reruns skip list_objects_v2 entirely.
+    """
+    listing_path = os.path.join(CACHE_DIR, "listing.json")
+    cached = _load_json(listing_path, {})
+    if (
+        cached.get("bucket") == S3_BUCKET
+        and cached.get("prefix") == prefix
+        and time.time() - cached.get("listed_at", 0.0) < LISTING_TTL_S
+    ):
+        return cached["objects"]
+    
+    objects = [
+        {"Key": obj["Key"], "ETag": obj.get("ETag", ""), "Size": obj.get("Size", 0)}
+        for page in paginator.paginate(Bucket=S3_BUCKET, Prefix=prefix)
+        for obj in page.get("Contents", [])
+        if obj["Key"].endswith("workload_results.csv")
+    ]
+    _save_json(listing_path, {
+        "bucket": S3_BUCKET,
+        "prefix": prefix,
+        "listed_at": time.time(),
+        "objects": objects,
+    })
+    return objects
+
+
+def _fetch_run(s3, obj: dict, etag_index: dict):
+    """
+    Load one workload_results.csv, from the local cache when its ETag is unchanged.
+    
+    Returns:
+        (df, cache_entry, cache_hit): cache_entry is the etag_index record for
+        this key, or None when the run could not be cached (no pyarrow).
+    """
+    key = obj["Key"]
+    entry = etag_index.get(key)
+    if (
+        pa is not None
+        and entry is not None
+        and entry.get("etag") == obj["ETag"]
+        and entry.get("size") == obj["Size"]
+        and os.path.exists(entry.get("path", ""))
+    ):
+        return pd.read_parquet(entry["path"]), entry, True
+    
+    # Result files are a few KB, so a single GetObject is cheaper than the
+    # multipart transfer manager behind download_fileobj
+    body = s3.get_object(Bucket=S3_BUCKET, Key=key)["Body"]
+    buf = io.BytesIO(body.read())
+    df = _read_results_csv(buf)
+    
+    # Extract run_id from S3 key (format: runs/run-YYYYMMDDTHHMMSSZ/workload_results.csv)
+    key_parts = key.split("/")
+    if len(key_parts) >= 2:
+        df["run_id"] = key_parts[1]
+    else:
+        df["run_id"] = "unknown"
+    
+    if pa is None:
+        return df, None, False
+    
+    cache_path = os.path.join(CACHE_DIR, "runs", hashlib.sha1(key.encode("utf-8")).hexdigest() + ".parquet")
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    df.to_parquet(cache_path, compression="zstd", index=False)
+    return df, {"etag": obj["ETag"], "size": obj["Size"], "path": cache_path}, False
+
+
+def _to_analysis_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalize one run to ANALYSIS_COLUMNS with fixed dtypes, so runs written
+    in either result format (latency_ms vs latency) combine into one table.
+    """
+    df = normalize_dataframe(df)
+    node = df["node"].astype("string") if "node" in df.columns else pd.Series(pd.NA, index=df.index, dtype="string")
+    return pd.DataFrame({
+        "run_id": df["run_id"].astype("string"),
+        "strategy": df["strategy"].astype("string"),
+        "node": node,
+        "latency": df["latency"].astype("float32"),
+    })
+
+
 def download_all_runs(prefix="runs/"):
     """
     Download all workload_results.csv files from S3 and combine into a single DataFrame.
     
+    Downloads run concurrently on a thread pool (S3_MAX_WORKERS threads).
+    Runs are cached in CACHE_DIR keyed by S3 ETag, so unchanged objects are
+    read from disk instead of being downloaded again.
+    Each run is normalized to ANALYSIS_COLUMNS, appended to a Parquet file at
+    COMBINED_PATH in listing order and dropped; the combined file is read
+    back once at the end. Without pyarrow the normalized runs are
+    concatenated in memory instead.
+    
     Returns:
         pd.DataFrame: Combined DataFrame with all runs, or empty DataFrame if no files found.
     """
     # Import boto3 only when needed (for S3 operations)
     try:
         import boto3
+        from botocore.config import Config
         from botocore.exceptions import ClientError, NoCredentialsError
     except ImportError as e:
         print("[ERROR] Missing required AWS dependencies (boto3, botocore).")
@@ -123,42 +307,62 @@ def download_all_runs(prefix="runs/"):
         return pd.DataFrame()
     
     try:
-        s3 = boto3.client("s3", region_name=REGION)
+        # Size the connection pool to the download threads so concurrent
+        # requests reuse connections instead of queueing for one
+        s3 = boto3.client(
+            "s3",
+            region_name=REGION,
+            config=Config(max_pool_connections=S3_MAX_WORKERS, retries={"mode": "adaptive"}),
+        )
     except (NoCredentialsError, Exception) as e:
         print(f"[ERROR] Failed to initialize S3 client: {e}")
         print("[INFO] Make sure AWS credentials are configured or run this script on an EC2 instance with IAM role.")
         return pd.DataFrame()
     
+    # Drain the paginator first so every download can be issued concurrently
     paginator = s3.get_paginator("list_objects_v2")
-    data_frames = []
+    etag_index_path = os.path.join(CACHE_DIR, "etag_index.json")
+    etag_index = _load_json(etag_index_path, {})
+    data_frames = []  # only used when pyarrow is unavailable
+    writer = None
     downloaded_count = 0
+    cached_count = 0
     
     try:
-        for page in paginator.paginate(Bucket=S3_BUCKET, Prefix=prefix):
-            if "Contents" not in page:
-                continue
-                
-            for obj in page["Contents"]:
-                if obj["Key"].endswith("workload_results.csv"):
-                    try:
-                        buf = io.BytesIO()
-                        s3.download_fileobj(S3_BUCKET, obj["Key"], buf)
-                        buf.seek(0)
-                        df = pd.read_csv(buf)
-                        
-                        # Extract run_id from S3 key (format: runs/run-YYYYMMDDTHHMMSSZ/workload_results.csv)
-                        key_parts = obj["Key"].split("/")
-                        if len(key_parts) >= 2:
-                            df["run_id"] = key_parts[1]
-                        else:
-                            df["run_id"] = "unknown"
-                        
+        objects = _list_result_objects(paginator, prefix)
+        
+        # boto3 clients are thread-safe; downloads are network-bound, so
+        # threads overlap the per-object round trips
+        with ThreadPoolExecutor(max_workers=S3_MAX_WORKERS) as executor:
+            futures = [(obj["Key"], executor.submit(_fetch_run, s3, obj, etag_index)) for obj in objects]
+            # Consume in listing order, so the combined rows do not depend
+            # on which download happens to finish first
+            for key, future in futures:
+                try:
+                    df, cache_entry, cache_hit = future.result()
+                    n_rows = len(df)
+                    if cache_entry is not None:
+                        etag_index[key] = cache_entry
+                    
+                    df = _to_analysis_frame(df)
+                    if pa is None:
                         data_frames.append(df)
+                    else:
+                        table = pa.Table.from_pandas(df, schema=_ANALYSIS_SCHEMA, preserve_index=False)
+                        if writer is None:
+                            os.makedirs(os.path.dirname(COMBINED_PATH) or ".", exist_ok=True)
+                            writer = pq.ParquetWriter(COMBINED_PATH, _ANALYSIS_SCHEMA)
+                        writer.write_table(table)
+                    del df
+                    if cache_hit:
+                        cached_count += 1
+                        print(f"[OK] Cached: {key} ({n_rows} rows)")
+                    else:
                         downloaded_count += 1
-                        print(f"[OK] Downloaded: {obj['Key']} ({len(df)} rows)")
-                    except Exception as e:
-                        print(f"[WARN] Failed to process {obj['Key']}: {e}")
-                        continue
+                        print(f"[OK] Downloaded: {key} ({n_rows} rows)")
+                except Exception as e:
+                    print(f"[WARN] Failed to process {key}: {e}")
+                    continue
     except ClientError as e:
         error_code = e.response.get('Error', {}).get('Code', '')
         if error_code == 'NoSuchBucket':
@@ -177,13 +381,25 @@ def download_all_runs(prefix="runs/"):
     except Exception as e:
         print(f"[ERROR] Unexpected error downloading from S3: {e}")
         return pd.DataFrame()
+    finally:
+        if writer is not None:
+            writer.close()
+        if etag_index:
+            _save_json(etag_index_path, etag_index)
     
-    if not data_frames:
+    if downloaded_count + cached_count == 0:
         print(f"[WARN] No workload_results.csv files found in s3://{S3_BUCKET}/{prefix}")
         return pd.DataFrame()
     
-    print(f"[OK] Downloaded {downloaded_count} result file(s)")
-    combined_df = pd.concat(data_frames, ignore_index=True)
+    print(f"[OK] Downloaded {downloaded_count} result file(s), {cached_count} unchanged from cache")
+    if pa is None:
+        # Single terminal concat; copy= is a no-op under pandas' copy-on-write
+        combined_df = pd.concat(data_frames, ignore_index=True, sort=False)
+    else:
+        # Memory-map the combined file; it only holds ANALYSIS_COLUMNS
+        combined_df = pq.read_table(COMBINED_PATH, memory_map=True).to_pandas()
+    # Labels are grouped on repeatedly downstream; keep them as integer codes
+    combined_df = combined_df.astype({"strategy": "category", "node": "category"})
     print(f"[OK] Combined DataFrame: {len(combined_df)} total rows")
     return combined_df
 
@@ -220,6 +436,13 @@ def main():
     
     print(f"[OK] Processing {len(df)} rows from {df['run_id'].nunique()} run(s)")
     
+    # Normalize once; aggregation and plotting reuse the normalized frame
+    try:
+        df = normalize_dataframe(df)
+    except Exception as e:
+        print(f"[ERROR] Failed to normalize results: {e}")
+        return 1
+    
     # Aggregate statistics
     try:
         stats_df = aggregate_latency(df)
@@ -238,20 +461,21 @@ def main():
     
     # Save statistics
     try:
-        stats_df.to_csv("analysis/out/summary_stats.csv", index=False)
+        write_results_table(stats_df, "analysis/out/summary_stats.csv")
         print(f"[OK] Saved summary stats -> analysis/out/summary_stats.csv")
     except Exception as e:
         print(f"[ERROR] Failed to save summary stats: {e}")
         return 1
     
-    # Generate visualizations
-    try:
-        plot_latency_distribution(df, "analysis/out/latency_summary.png")
-        print(f"[OK] Saved plot -> analysis/out/latency_summary.png")
-    except Exception as e:
-        print(f"[WARN] Failed to generate plot: {e}")
-        import traceback
-        traceback.print_exc()
+    # Generate visualizations (PLOT=0 skips them)
+    if os.getenv("PLOT", "1") == "1":
+        try:
+            plot_latency_distribution(df, "analysis/out/latency_summary.png")
+            print(f"[OK] Saved plot -> analysis/out/latency_summary.png")
+        except Exception as e:
+            print(f"[WARN] Failed to generate plot: {e}")
+            import traceback
+            traceback.print_exc()
     
     # Generate markdown summary
     try:
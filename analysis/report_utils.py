@@ -4,9 +4,6 @@ Handles multiple CSV formats from different experiment types.
 """
 import pandas as pd
 import numpy as np
-import matplotlib
-matplotlib.use("Agg")  # Use non-interactive backend
-import matplotlib.pyplot as plt
 import os
 
 
@@ -17,8 +14,15 @@ def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     Handles two formats:
     1. RL-only format: task_id, node, latency_ms
     2. Multi-strategy format: strategy, app_type, size_mb, priority, node, latency
+    
+    The result is tagged with df.attrs["normalized"], so normalizing it again
+    returns it unchanged.
     """
-    df = df.copy()  # Don't modify original
+    if df.attrs.get("normalized"):
+        return df
+    
+    # Only columns are renamed/replaced below, so the data blocks can be shared
+    df = df.copy(deep=False)  # Don't modify original
     
     # Normalize latency column name
     if "latency_ms" in df.columns:
@@ -30,9 +34,17 @@ def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     if "strategy" not in df.columns:
         if "node" in df.columns:
             # RL-only format: derive strategy from node type
-            df["strategy"] = df["node"].apply(
-                lambda x: "RL-Edge" if "edge" in str(x).lower() else "RL-Cloud"
-            )
+            node = df["node"]
+            if isinstance(node.dtype, pd.CategoricalDtype):
+                # Only the distinct node names need inspecting; the trailing
+                # label is picked up by code -1 (missing node)
+                cats = node.cat.categories.astype("string")
+                labels = np.where(cats.str.contains("edge", case=False, na=False), "RL-Edge", "RL-Cloud")
+                labels = np.append(labels, "RL-Cloud")
+                df["strategy"] = labels[node.cat.codes.to_numpy()]
+            else:
+                is_edge = node.astype("string").str.contains("edge", case=False, na=False)
+                df["strategy"] = np.where(is_edge, "RL-Edge", "RL-Cloud")
         else:
             # Default to RL if no strategy or node info
             df["strategy"] = "RL"
@@ -42,6 +54,7 @@ def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     
     # Drop rows with invalid latency values
     df = df.dropna(subset=["latency"])
+    df.attrs["normalized"] = True
     
     return df
 
@@ -51,7 +64,8 @@ def aggregate_latency(df: pd.DataFrame) -> pd.DataFrame:
     Aggregate latency statistics by strategy.
     
     Args:
-        df: DataFrame with latency data (will be normalized)
+        df: DataFrame with latency data, ideally already passed through
+            normalize_dataframe (otherwise it is normalized here)
         
     Returns:
         DataFrame with columns: strategy, mean, std, count, sem
@@ -68,15 +82,37 @@ def aggregate_latency(df: pd.DataFrame) -> pd.DataFrame:
     if "latency" not in df.columns or "strategy" not in df.columns:
         raise ValueError("DataFrame must contain 'latency' and 'strategy' columns after normalization")
     
-    # Group by strategy and compute statistics
-    grouped = df.groupby("strategy")["latency"].agg(["mean", "std", "count"])
-    grouped["sem"] = grouped["std"] / np.sqrt(grouped["count"])  # Standard error of mean
+    # Single pass over the latency array keyed by categorical codes instead of
+    # a pandas groupby (which materializes a copy of every group)
+    strategy = df["strategy"].astype("category")
+    codes = strategy.cat.codes.to_numpy()
+    lat = df["latency"].to_numpy(np.float64)
+    n_cats = len(strategy.cat.categories)
+    
+    count = np.bincount(codes, minlength=n_cats)
+    mean = np.bincount(codes, weights=lat, minlength=n_cats) / np.maximum(count, 1)
+    # Sum squared deviations from the group mean rather than sum(x^2) - n*mean^2
+    # to avoid cancellation on large latencies
+    sq_dev = np.bincount(codes, weights=(lat - mean[codes]) ** 2, minlength=n_cats)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        std = np.sqrt(sq_dev / (count - 1))
+        sem = std / np.sqrt(count)  # Standard error of mean
+    
+    # Keep only strategies that actually occur, matching groupby(observed=True)
+    present = count > 0
+    grouped = pd.DataFrame({
+        "strategy": np.asarray(strategy.cat.categories)[present],
+        "mean": mean[present],
+        "std": std[present],
+        "count": count[present],
+        "sem": sem[present],
+    })
     
     # Fill NaN std with 0 (for single-value groups)
     grouped["std"] = grouped["std"].fillna(0.0)
     grouped["sem"] = grouped["sem"].fillna(0.0)
     
-    return grouped.reset_index()
+    return grouped
 
 
 def plot_latency_distribution(df: pd.DataFrame, out_path: str):
@@ -84,7 +120,8 @@ def plot_latency_distribution(df: pd.DataFrame, out_path: str):
     Generate box plot of latency distributions by strategy.
     
     Args:
-        df: DataFrame with latency data
+        df: DataFrame with latency data, ideally already passed through
+            normalize_dataframe (otherwise it is normalized here)
         out_path: Output path for the plot
     """
     if df.empty:
@@ -102,35 +139,41 @@ def plot_latency_distribution(df: pd.DataFrame, out_path: str):
         print("[WARN] Missing required columns for plotting")
         return
     
-    # Create box plot
-    plt.figure(figsize=(10, 6))
+    # matplotlib is only imported when a plot is actually drawn; a bare
+    # Figure on an Agg canvas skips pyplot's figure manager entirely
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
     
-    # Get unique strategies
-    strategies = df["strategy"].unique()
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    
+    # Split latencies by strategy in one groupby pass (first-appearance order)
+    groups = df.groupby("strategy", sort=False, observed=True)["latency"]
+    strategies = [name for name, _ in groups]
+    data_by_strategy = [g.to_numpy() for _, g in groups]
     
     if len(strategies) == 1:
         # Single strategy - simple box plot
-        plt.boxplot(df["latency"])
-        plt.xticks([1], [strategies[0]])
-        plt.ylabel("Latency (ms)")
-        plt.title(f"Latency Distribution: {strategies[0]}")
+        ax.boxplot(data_by_strategy[0])
+        ax.set_xticks([1], [strategies[0]])
+        ax.set_ylabel("Latency (ms)")
+        ax.set_title(f"Latency Distribution: {strategies[0]}")
     else:
         # Multiple strategies - grouped box plot
-        data_by_strategy = [df[df["strategy"] == s]["latency"].values for s in strategies]
-        plt.boxplot(data_by_strategy)
-        plt.xticks(range(1, len(strategies) + 1), strategies)
-        plt.ylabel("Latency (ms)")
-        plt.xlabel("Strategy")
-        plt.title("Latency Distribution per Strategy")
+        ax.boxplot(data_by_strategy)
+        ax.set_xticks(range(1, len(strategies) + 1), strategies)
+        ax.set_ylabel("Latency (ms)")
+        ax.set_xlabel("Strategy")
+        ax.set_title("Latency Distribution per Strategy")
     
-    plt.grid(True, linestyle="--", alpha=0.5, axis="y")
-    plt.tight_layout()
+    ax.grid(True, linestyle="--", alpha=0.5, axis="y")
+    fig.tight_layout()
     
     # Ensure output directory exists
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
     
-    plt.savefig(out_path, dpi=120)
-    plt.close()
+    fig.savefig(out_path, dpi=120)
     print(f"[OK] Saved plot -> {out_path}")
 
 
@@ -157,15 +200,18 @@ def write_summary_md(stats_df: pd.DataFrame, out_path: str):
         f.write("| Strategy | Mean (ms) | Std Dev (ms) | Count | SEM (ms) |\n")
         f.write("|----------|-----------|--------------|-------|----------|\n")
         
-        # Write statistics for each strategy
-        for _, row in stats_df.iterrows():
-            strategy = row["strategy"]
-            mean = row["mean"]
-            std = row["std"] if "std" in row else 0.0
-            count = int(row["count"]) if "count" in row else 0
-            sem = row["sem"] if "sem" in row else 0.0
-            
-            f.write(f"| **{strategy}** | {mean:.2f} | {std:.2f} | {count} | {sem:.2f} |\n")
+        # Format whole columns at once and write the table body in one call
+        def fmt(col):
+            if col not in stats_df:
+                return "0.00"
+            return stats_df[col].map("{:.2f}".format)
+        
+        counts = stats_df["count"].astype(int).astype(str) if "count" in stats_df else "0"
+        rows = (
+            "| **" + stats_df["strategy"].astype(str) + "** | " + fmt("mean") + " | " + fmt("std")
+            + " | " + counts + " | " + fmt("sem") + " |\n"
+        )
+        f.write("".join(rows))
         
         f.write("\n")
         f.write("**Legend:**\n")
@@ -1,18 +1,14 @@
 # main.py
-from orchestrator.environment import Task, Node
+from orchestrator.environment import Task, Node, execute_placements
 from orchestrator.random_orchestrator import RandomOrchestrator
 from orchestrator.rule_orchestrator import RuleBasedOrchestrator
-from orchestrator.rule_orchestrator import RuleBasedOrchestrator
-from orchestrator.rl_orchestrator import RLBasedOrchestrator
-from orchestrator.environment import Node, Task # Ensure Node/Task are imported for static classes
+from orchestrator.rl_orchestrator import RLBasedOrchestrator, APP_INDEX, PRIORITY_INDEX
 from orchestrator.sim_interface import get_simulator
 from orchestrator.workload_generator import WorkloadGenerator
 import pandas as pd
 import numpy as np
-import random
-import matplotlib.pyplot as plt
-import seaborn as sns
 import os
+import sys
 
 # Import safe print utility
 try:
@@ -50,24 +46,65 @@ class StaticCloudOrchestrator:
 # ---------------------------------------------------------------------
 # Main execution pipeline
 # ---------------------------------------------------------------------
-def run_with_workload():
+def _category_indices(cat: pd.Categorical, index: dict) -> np.ndarray:
+    """index[label.lower()] for each category of `cat`; unknown labels raise KeyError."""
+    codes = cat.categories.str.lower().map(index)
+    unknown = codes.isna()
+    if unknown.any():
+        raise KeyError(f"unknown labels {list(cat.categories[unknown])}; expected one of {list(index)}")
+    return codes.to_numpy(np.int8)
+
+
+def run_with_workload(plot: bool | None = None):
+    # Plotting is on by default; PLOT=0 (or --no-plot) skips it and the
+    # matplotlib import entirely
+    if plot is None:
+        plot = os.getenv("PLOT", "1") == "1"
+
     # Step 1 - Generate or load workloads
     # Use Poisson lambda=3.0 as per proposal
     gen = WorkloadGenerator(num_tasks=300, poisson_lambda=3.0)
     gen.generate()
-    df_work = pd.read_csv("data/workloads.csv")
+    # Only the columns used below, parsed straight to their final dtypes
+    df_work = pd.read_csv(
+        "data/workloads.csv",
+        usecols=["app_type", "size_mb", "priority"],
+        dtype={"app_type": "category", "size_mb": np.float32, "priority": "category"},
+    )
+
+    # Pull the task columns out once as contiguous arrays (struct-of-arrays);
+    # the evaluation below indexes these instead of building Task objects.
+    n_tasks = len(df_work)
+    sizes = df_work["size_mb"].to_numpy()
+    prios = df_work["priority"].to_numpy()
+    apps = df_work["app_type"].to_numpy()
+    app_cat = df_work["app_type"].array
+    prio_cat = df_work["priority"].array
+    # RL state indices, using the encoding of RLBasedOrchestrator._get_state;
+    # each category is lower-cased and looked up once, then spread by code
+    rl_app_idx = _category_indices(app_cat, APP_INDEX)[app_cat.codes]
+    rl_prio_idx = _category_indices(prio_cat, PRIORITY_INDEX)[prio_cat.codes]
+
+    # Non-RL placements only depend on the task itself, so decide them up
+    # front as edge masks and execute each strategy as one batch
+    edge_masks = {
+        "Rule": (sizes < 5) | (prios == "high"),
+        "StaticEdge": np.ones(n_tasks, dtype=bool),
+        "StaticCloud": np.zeros(n_tasks, dtype=bool),
+    }
 
     # Step 2 - Initialize network simulator
     SIM_CHOICE = os.getenv("SIM_TYPE", "simple")  # default = FiveGDistributedSimulator
     sim = get_simulator(SIM_CHOICE)
     safe_print(f"[OK] Using simulator: {SIM_CHOICE}", fallback=f"[OK] Using simulator: {SIM_CHOICE}")
 
-    all_records = []
-
     # Step 3 - Node factory
     def make_nodes():
         return Node(0, "edge", 2.0), Node(1, "cloud", 8.0)
 
+    # Nodes are recorded by code (0 = edge, 1 = cloud) and decoded at the end
+    node_labels = [node.name for node in make_nodes()]
+
     # Step 4 - Strategy registry
     strategies = {
         "Random": RandomOrchestrator,
@@ -77,108 +114,169 @@ def run_with_workload():
         "StaticCloud": StaticCloudOrchestrator,
     }
 
+    # Preallocate the combined result columns for every strategy up front;
+    # each strategy fills its own contiguous block of n_tasks rows.
+    n_rows = n_tasks * len(strategies)
+    strategy_arr = np.empty(n_rows, dtype=np.int8)
+    node_arr = np.empty(n_rows, dtype=np.int8)
+    latency_arr = np.empty(n_rows, dtype=np.float32)
+    energy_arr = np.empty(n_rows, dtype=np.float32)
+    idx = 0
+
     # Step 5 - Evaluate each strategy
-    for name, OrchClass in strategies.items():
+    for strategy_code, (name, OrchClass) in enumerate(strategies.items()):
         edge, cloud = make_nodes()
 
         if name == "RL":
             orch = OrchClass(edge, cloud, episodes=300)
             orch.set_simulator(sim)       # attach simulator dynamically
-            orch.set_simulator(sim)       # attach simulator dynamically
             
             # RETRAIN because we changed the environment physics (Bandwidth 100 -> 20)
             safe_print("[INFO] Retraining RL agent to adapt to new 20Mbps constraints...")
             orch.simulate_environment(num_tasks=300) # One training pass
             orch.save_weights("data/rl_weights.npy")
-            
-            # Load pre-trained weights if available (critical for valid comparison)
-            orch.load_weights("data/rl_weights.npy")
+
+            # The trained weights are already in memory; reloading is only
+            # useful to check the save/load round trip
+            if os.getenv("DEBUG_WEIGHT_ROUNDTRIP") == "1":
+                orch.load_weights("data/rl_weights.npy")
+        elif name == "Random":
+            seed = os.getenv("SEED")
+            orch = OrchClass(edge, cloud, seed=int(seed) if seed else None)
         else:
             orch = OrchClass(edge, cloud)
 
-        latencies = []
-        energies = []
-        for _, row in df_work.iterrows():
-            task = Task(int(row.task_id), row.app_type, float(row.size_mb), row.priority)
+        start = idx
+        to_edge = edge_masks.get(name)
+        if name == "Random":
+            to_edge = orch.edge_mask(n_tasks)
+        if name == "RL":
+            # With a state-free action term the trained greedy policy sends
+            # every task to the same node, and RL runs as a batch as well
+            action = orch.state_free_greedy_action()
+            if action is not None:
+                to_edge = np.full(n_tasks, action == 0)
 
-            energy = 0.0
-            if name == "RL":
-                # Use enhanced state representation with node loads
-                state = orch._get_state(task, orch.edge.current_load, orch.cloud.current_load)
+        if to_edge is None:
+            for i in range(n_tasks):
+                size = float(sizes[i])
+                # Same (app_idx, prio_idx, size_mb, load_norm) state as orch._get_state
+                avg_load = (edge.current_load + cloud.current_load) / 2.0
+                state = (int(rl_app_idx[i]), int(rl_prio_idx[i]), size, min(1.0, max(0.0, avg_load / 100.0)))
                 action = orch.choose_action_greedy(state)
-                # Updated unpacked: node, latency, energy
-                node_name, latency, energy = orch.assign_and_execute(task, action)
-
-            elif name == "Rule":
-                node = orch.edge if (task.size_mb < 5 or task.priority == "high") else orch.cloud
-                # Updated unpacked: latency, energy
-                latency, energy = node.execute_task(task, network_sim=sim)
-                node_name = node.name
-
-            elif name == "StaticEdge":
-                node = orch.edge
-                latency, energy = node.execute_task(task, network_sim=sim)
-                node_name = node.name
-
-            elif name == "StaticCloud":
-                node = orch.cloud
-                latency, energy = node.execute_task(task, network_sim=sim)
-                node_name = node.name
-
-            else:  # Random baseline
-                node = orch.edge if random.choice([True, False]) else orch.cloud
-                # Updated unpacked: latency, energy
-                latency, energy = node.execute_task(task, network_sim=sim)
-                node_name = node.name
-
-            all_records.append({
-                "strategy": name,
-                "app_type": row.app_type,
-                "size_mb": row.size_mb,
-                "priority": row.priority,
-                "node": node_name,
-                "latency": latency,
-                "energy": energy
-            })
-            latencies.append(latency)
-            energies.append(energy)
+                node = edge if action == 0 else cloud
+                latency, energy = node.execute(size, apps[i], network_sim=orch.sim)
+
+                node_arr[idx] = action
+                latency_arr[idx] = latency
+                energy_arr[idx] = energy
+                idx += 1
+        else:
+            latencies, energies = execute_placements(edge, cloud, sizes, to_edge, apps, network_sim=sim)
+            idx += n_tasks
+            node_arr[start:idx] = np.where(to_edge, 0, 1)
+            latency_arr[start:idx] = latencies
+            energy_arr[start:idx] = energies
+        strategy_arr[start:idx] = strategy_code
+
+        latencies = latency_arr[start:idx]
+        energies = energy_arr[start:idx]
 
         safe_print(f"[OK] {name} done | avg lat: {np.mean(latencies):.2f} ms | avg energy: {np.mean(energies):.2f} J",
                    fallback=f"[OK] {name} done | avg lat: {np.mean(latencies):.2f} ms | avg energy: {np.mean(energies):.2f} J")
 
+    # Finish any emulated simulator delay (Simu5G round trips) still owed
+    sim.flush_delay()
+
     # Step 6 - Save & visualize
-    df = pd.DataFrame(all_records)
-    df.to_csv("data/workload_results.csv", index=False)
-    plot_latency_by_app(df)
+    n_strategies = len(strategies)
+    df = pd.DataFrame({
+        "strategy": pd.Categorical.from_codes(strategy_arr, categories=list(strategies)),
+        "app_type": pd.Categorical.from_codes(np.tile(app_cat.codes, n_strategies), categories=app_cat.categories),
+        "size_mb": np.tile(sizes, n_strategies),
+        "priority": pd.Categorical.from_codes(np.tile(prio_cat.codes, n_strategies), categories=prio_cat.categories),
+        "node": pd.Categorical.from_codes(node_arr, categories=node_labels),
+        "latency": latency_arr,
+        "energy": energy_arr,
+    })
+    # Fixed-precision CSV for existing consumers, plus a Parquet copy that
+    # keeps the categorical/float32 columns without text formatting
+    df.to_csv("data/workload_results.csv", index=False, float_format="%.3f")
+    wrote_parquet = False
+    try:
+        df.to_parquet("data/workload_results.parquet", compression="snappy", index=False)
+        wrote_parquet = True
+    except ImportError:
+        pass  # pyarrow not installed; CSV only
+    if plot:
+        plot_latency_by_app(df)
 
     safe_print("\n[OK] Outputs generated:", fallback="\n[OK] Outputs generated:")
     print("data/workload_results.csv")
-    print("data/workload_comparison.png")
+    if wrote_parquet:  # a file left by an earlier run is not this run's output
+        print("data/workload_results.parquet")
+    if plot:
+        print("data/workload_comparison.png")
 
 
 # ---------------------------------------------------------------------
 # Plot results
 # ---------------------------------------------------------------------
 def plot_latency_by_app(df: pd.DataFrame):
-    plt.close("all")
-    plt.figure(figsize=(9, 6))
-    sns.boxplot(
-        x="app_type",
-        y="latency",
-        hue="strategy",
-        data=df,
-        palette="Set2"
-    )
-    plt.title("Latency Comparison per App Type & Strategy")
-    plt.ylabel("Latency (ms)")
-    plt.xlabel("Application Type")
-    plt.legend(title="Strategy")
-    plt.xticks(rotation=15)
-    plt.tight_layout()
-    plt.savefig("data/workload_comparison.png", dpi=130)
-    plt.close()
+    # Draw on a bare Figure with an Agg canvas; pyplot's figure manager and
+    # backend selection are never touched
+    from matplotlib import colormaps
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Patch
+
+    # Box statistics come from per-group quantiles; only points past the
+    # 1.5 IQR fences are passed on individually, as outliers
+    keys = ["app_type", "strategy"]
+    q = df.groupby(keys, observed=True)["latency"].quantile([0.25, 0.5, 0.75]).unstack()
+    q.columns = ["q1", "med", "q3"]
+    iqr = q["q3"] - q["q1"]
+    row_groups = pd.MultiIndex.from_frame(df[keys])
+    fence_lo = (q["q1"] - 1.5 * iqr).reindex(row_groups).to_numpy()
+    fence_hi = (q["q3"] + 1.5 * iqr).reindex(row_groups).to_numpy()
+    latency = df["latency"].to_numpy()
+    inside = (latency >= fence_lo) & (latency <= fence_hi)
+    # Whiskers end at the most extreme points inside the fences
+    whiskers = df[inside].groupby(keys, observed=True)["latency"].agg(["min", "max"])
+    fliers = {k: g.to_numpy() for k, g in df[~inside].groupby(keys, observed=True)["latency"]}
+    app_types = list(dict.fromkeys(q.index.get_level_values("app_type")))
+    strategies = list(dict.fromkeys(q.index.get_level_values("strategy")))
+    width = 0.8 / len(strategies)
+    colors = colormaps["Set2"].colors
+
+    fig = Figure(figsize=(9, 6), layout="constrained")
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    handles = []
+    for j, strategy in enumerate(strategies):
+        stats, positions = [], []
+        for i, app in enumerate(app_types):
+            if (app, strategy) not in q.index:
+                continue
+            q1, med, q3 = q.loc[(app, strategy)]
+            whislo, whishi = whiskers.loc[(app, strategy)]
+            stats.append(dict(med=med, q1=q1, q3=q3, whislo=whislo, whishi=whishi,
+                              fliers=fliers.get((app, strategy), [])))
+            positions.append(i - 0.4 + width * (j + 0.5))
+        color = colors[j % len(colors)]
+        ax.bxp(stats, positions=positions, widths=width * 0.9, patch_artist=True,
+               boxprops=dict(facecolor=color), medianprops=dict(color="black"),
+               flierprops=dict(marker="d", markersize=4, markerfacecolor="0.3", markeredgecolor="none"))
+        handles.append(Patch(facecolor=color, edgecolor="black", label=strategy))
+
+    ax.set_xticks(range(len(app_types)), app_types, rotation=15)
+    ax.set_title("Latency Comparison per App Type & Strategy")
+    ax.set_ylabel("Latency (ms)")
+    ax.set_xlabel("Application Type")
+    ax.legend(handles=handles, title="Strategy")
+    fig.savefig("data/workload_comparison.png", dpi=130)
 
 
 # ---------------------------------------------------------------------
 if __name__ == "__main__":
-    run_with_workload()
+    run_with_workload(plot=False if "--no-plot" in sys.argv else None)
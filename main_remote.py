@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from orchestrator.workload_generator import WorkloadGenerator
 from train_rl import train_and_eval
 from utils.s3_io import upload_file
@@ -36,7 +37,7 @@ def ensure_workload():
                    fallback="[CONFIG] No workloads.csv found -> generating new one...")
         if cw_logger:
             cw_logger.info("Generating new workload file")
-        WorkloadGenerator(num_tasks=300, poisson_lambda=3.0).generate()
+        WorkloadGenerator(num_tasks=300, poisson_lambda=3.0, out_dir=DATA_DIR).generate()
     else:
         safe_print("[OK] Workload already present; re-using existing file.",
                    fallback="[OK] Workload already present; re-using existing file.")
@@ -74,6 +75,7 @@ def main():
             cw_logger.error(f"Training failed: {str(e)}")
         if cw_metrics:
             cw_metrics.put_completion_metric(False, 300)
+            cw_metrics.flush()
         raise
     
     prefix = get_s3_prefix()
@@ -87,7 +89,7 @@ def main():
         tasks=300,
         avg_latency=avg_latency or 0.0
     )
-    manifest_path = save_manifest_local(manifest)
+    manifest_path = save_manifest_local(manifest, data_dir=DATA_DIR)
     safe_print(f"[OK] Manifest saved -> {manifest_path}",
                fallback=f"[OK] Manifest saved -> {manifest_path}")
     if cw_logger:
@@ -104,27 +106,24 @@ def main():
     uploaded_count = 0
     failed_count = 0
     
-    for fname in [
+    artifacts = [
         "rl_weights.npy",
         "workload_results.csv",
+        "workload_results.parquet",
         "workload_comparison.png",
         "reward_curve.png",
         "manifest.json"
-    ]:
-        path = os.path.join(DATA_DIR, fname)
-        if os.path.exists(path):
-            try:
-                upload_file(path, key_prefix=prefix)
-                safe_print(f"[OK] Uploaded -> {fname}", fallback=f"[OK] Uploaded -> {fname}")
-                if cw_logger:
-                    cw_logger.info(f"Successfully uploaded {fname}")
-                uploaded_count += 1
-            except Exception as e:
-                safe_print(f"[WARN] Failed to upload {fname}: {e}",
-                          fallback=f"[WARN] Failed to upload {fname}: {e}")
-                if cw_logger:
-                    cw_logger.warning(f"Failed to upload {fname}: {str(e)}")
-                failed_count += 1
+    ]
+    # One directory listing instead of a stat per artifact
+    try:
+        entries = {e.name: e.path for e in os.scandir(DATA_DIR) if e.is_file()}
+    except FileNotFoundError:
+        entries = {}
+    present = []
+    for fname in artifacts:
+        path = entries.get(fname)
+        if path is not None:
+            present.append((fname, path))
         else:
             safe_print(f"[WARN] Skipping missing file: {fname}",
                       fallback=f"[WARN] Skipping missing file: {fname}")
@@ -132,6 +131,29 @@ def main():
                 cw_logger.warning(f"Missing file: {fname}")
             failed_count += 1
 
+    # Uploads are network-bound, so run them side by side; results are
+    # logged and counted here on the main thread as they complete
+    if present:
+        with ThreadPoolExecutor(max_workers=len(present)) as executor:
+            futures = {
+                executor.submit(upload_file, path, key_prefix=prefix): fname
+                for fname, path in present
+            }
+            for future in as_completed(futures):
+                fname = futures[future]
+                try:
+                    future.result()
+                    safe_print(f"[OK] Uploaded -> {fname}", fallback=f"[OK] Uploaded -> {fname}")
+                    if cw_logger:
+                        cw_logger.info(f"Successfully uploaded {fname}")
+                    uploaded_count += 1
+                except Exception as e:
+                    safe_print(f"[WARN] Failed to upload {fname}: {e}",
+                              fallback=f"[WARN] Failed to upload {fname}: {e}")
+                    if cw_logger:
+                        cw_logger.warning(f"Failed to upload {fname}: {str(e)}")
+                    failed_count += 1
+
     # Publish completion metrics
     if cw_metrics:
         cw_metrics.put_metric("S3UploadSuccess", uploaded_count, "Count",
@@ -139,6 +161,7 @@ def main():
         cw_metrics.put_metric("S3UploadFailure", failed_count, "Count",
                             dimensions={"RunID": RUN_ID})
         cw_metrics.put_completion_metric(True, 300)
+        cw_metrics.flush()
 
     safe_print("\n[OK] Remote execution complete.",
                fallback="\n[OK] Remote execution complete.")
@@ -1,9 +1,13 @@
 # orchestrator/environment.py
 from __future__ import annotations
+import functools
+import inspect
 import random
-from dataclasses import dataclass
+import numpy as np
 from typing import Optional
 
+from orchestrator.jit import njit, prange
+
 try:
     # optional import so Week-6 still runs without the new file
     from orchestrator.sim_interface import NetworkSimulator
@@ -11,33 +15,70 @@ except Exception:  # pragma: no cover
     NetworkSimulator = None  # type: ignore
 
 
-@dataclass
-# orchestrator/environment.py
-
 class Task:
     """
     Represents a computational task with an app type, size (MB), and priority.
     """
+    __slots__ = ("task_id", "app_type", "size_mb", "priority")
+
     def __init__(self, task_id, app_type, size_mb, priority):
         self.task_id = task_id
-        self.app_type = app_type
+        self.app_type = str(app_type).lower()  # "iot" / "arvr" / "vanet"
         self.size_mb = size_mb
-        self.priority = priority
+        self.priority = str(priority).lower()  # "low" / "medium" / "high"
 
     def __repr__(self):
         return f"Task(id={self.task_id}, app={self.app_type}, size={self.size_mb}MB, prio={self.priority})"
 
 
+@functools.lru_cache(maxsize=8)
+def _sim_signature_kind(sim_cls) -> str:
+    """
+    How Node should call a simulator class, decided once per class:
+    "enhanced" (takes task_size_mb/node_load), "basic" (node_type, app_type
+    only) or "none" (no simulate_latency).
+    """
+    simulate = getattr(sim_cls, "simulate_latency", None)
+    if simulate is None:
+        return "none"
+    try:
+        params = inspect.signature(simulate).parameters
+    except (TypeError, ValueError):
+        return "enhanced"  # not introspectable; assume the current API
+    return "enhanced" if {"task_size_mb", "node_load"}.issubset(params) else "basic"
+
+
+@njit(cache=True)
+def _execute_cost(size_mb, net_latency_s, proc_ms_per_mb, energy_j_per_mb, power_watts):
+    """
+    (latency_ms, energy_joules) of one task on a node: processing delay plus
+    network latency, and energy = power * time. Shared by Node.execute and
+    the compiled batch/training kernels.
+    """
+    return (size_mb * proc_ms_per_mb + net_latency_s * 1000.0,
+            size_mb * energy_j_per_mb + power_watts * net_latency_s)
+
+
 class Node:
     """
     Represents a compute node — edge or cloud — capable of executing tasks.
     """
+    __slots__ = ("node_id", "node_type", "capacity_mbps", "current_load", "name",
+                 "power_watts", "_proc_ms_per_mb", "_energy_j_per_mb")
+
     def __init__(self, node_id, node_type, capacity_mbps):
         self.node_id = node_id
         self.node_type = node_type.lower()  # "edge" or "cloud"
         self.capacity_mbps = capacity_mbps
         self.current_load = 0.0
         self.name = f"{self.node_type}_{self.node_id}"   # ensures main.py can use node.name
+        # Assumed Power Models:
+        # Edge: Idle 2W, Active 10W
+        # Cloud: Idle 10W, Active 50W (per allocation unit logic)
+        self.power_watts = 10.0 if self.node_type == "edge" else 50.0
+        # Per-MB constants so execute() needs one multiply per quantity
+        self._proc_ms_per_mb = 1000.0 / capacity_mbps
+        self._energy_j_per_mb = self.power_watts / capacity_mbps
 
 
     def execute_task(self, task, network_sim=None):
@@ -46,42 +87,102 @@ class Node:
         If a network simulator is provided, it adds latency accordingly.
         Returns: (latency_ms, energy_joules)
         """
-        # processing delay (seconds)
-        processing_time = task.size_mb / self.capacity_mbps
+        return self.execute(task.size_mb, task.app_type, network_sim=network_sim)
+
+    def execute(self, size_mb, app_type, network_sim=None):
+        """
+        execute_task on plain task fields, for callers holding tasks as arrays.
+        Returns: (latency_ms, energy_joules)
+        """
+        if network_sim is None:
+            # No network leg: latency and energy are pure processing cost
+            self.current_load += size_mb
+            return _execute_cost(size_mb, 0.0, self._proc_ms_per_mb, self._energy_j_per_mb, self.power_watts)
 
         # network latency
-        net_latency = 0.0
-        if network_sim is not None:
-            try:
-                if hasattr(network_sim, 'simulate_latency'):
-                    try:
-                        net_latency = network_sim.simulate_latency(
-                            self.node_type, 
-                            task.app_type, 
-                            task_size_mb=task.size_mb,
-                            node_load=self.current_load
-                        )
-                    except TypeError:
-                        net_latency = network_sim.simulate_latency(self.node_type, task.app_type)
-                else:
-                    net_latency = 0.001  # fallback
-            except Exception as e:
-                net_latency = 0.001
-
-        total_latency_sec = processing_time + net_latency
-        total_latency_ms = total_latency_sec * 1000  # convert to ms
-        
-        # Energy Calculation: Energy (J) = Power (W) * Time (s)
-        # Assumed Power Models:
-        # Edge: Idle 2W, Active 10W
-        # Cloud: Idle 10W, Active 50W (per allocation unit logic)
-        power_watts = 10.0 if self.node_type == "edge" else 50.0
-        energy_joules = power_watts * total_latency_sec
+        kind = _sim_signature_kind(type(network_sim))
+        if kind == "enhanced":
+            net_latency = network_sim.simulate_latency(
+                self.node_type,
+                app_type,
+                task_size_mb=size_mb,
+                node_load=self.current_load
+            )
+        elif kind == "basic":
+            net_latency = network_sim.simulate_latency(self.node_type, app_type)
+        else:
+            net_latency = 0.001  # fallback
 
-        self.current_load += task.size_mb
+        # processing delay + network latency (ms), and energy = power * time (J)
+        total_latency_ms, energy_joules = _execute_cost(
+            size_mb, net_latency, self._proc_ms_per_mb, self._energy_j_per_mb, self.power_watts)
+
+        self.current_load += size_mb
         return total_latency_ms, energy_joules
 
     def reset_load(self):
         self.current_load = 0.0
 
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _execute_kernel(sizes, to_edge, net_latency, edge_proc_ms_per_mb, cloud_proc_ms_per_mb,
+                    edge_energy_j_per_mb, cloud_energy_j_per_mb, edge_power, cloud_power,
+                    out_latency_ms, out_energy_j):
+    """_execute_cost over a batch of placed tasks."""
+    for i in prange(sizes.shape[0]):
+        if to_edge[i]:
+            out_latency_ms[i], out_energy_j[i] = _execute_cost(
+                sizes[i], net_latency[i], edge_proc_ms_per_mb, edge_energy_j_per_mb, edge_power)
+        else:
+            out_latency_ms[i], out_energy_j[i] = _execute_cost(
+                sizes[i], net_latency[i], cloud_proc_ms_per_mb, cloud_energy_j_per_mb, cloud_power)
+
+
+def execute_placements(edge, cloud, sizes, to_edge, app_types, network_sim=None):
+    """
+    Execute a batch of tasks already placed on `edge` (to_edge True) or `cloud`.
+    
+    Equivalent to calling execute_task for each task in order: the load a task
+    sees is its node's load plus the sizes of the earlier tasks on that node.
+    Every NetworkSimulator provides simulate_latency_batch; other simulator
+    objects fall back to the per-task path.
+    Returns: (latency_ms, energy_joules) arrays
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    to_edge = np.asarray(to_edge, dtype=np.bool_)
+
+    if network_sim is not None and not hasattr(network_sim, "simulate_latency_batch"):
+        latency_ms = np.empty(len(sizes))
+        energy_j = np.empty(len(sizes))
+        for i in range(len(sizes)):
+            node = edge if to_edge[i] else cloud
+            latency_ms[i], energy_j[i] = node.execute(float(sizes[i]), app_types[i], network_sim=network_sim)
+        return latency_ms, energy_j
+
+    edge_sizes = np.where(to_edge, sizes, 0.0)
+    cloud_sizes = sizes - edge_sizes
+    # Exclusive running totals = load on the node just before each task
+    load = np.where(
+        to_edge,
+        edge.current_load + np.cumsum(edge_sizes) - edge_sizes,
+        cloud.current_load + np.cumsum(cloud_sizes) - cloud_sizes,
+    )
+
+    if network_sim is not None:
+        net_latency = np.asarray(network_sim.simulate_latency_batch(to_edge, sizes, load, app_types), dtype=np.float64)
+    else:
+        net_latency = np.zeros(len(sizes))
+
+    latency_ms = np.empty(len(sizes))
+    energy_j = np.empty(len(sizes))
+    _execute_kernel(sizes, to_edge, net_latency,
+                    edge._proc_ms_per_mb, cloud._proc_ms_per_mb,
+                    edge._energy_j_per_mb, cloud._energy_j_per_mb,
+                    float(edge.power_watts), float(cloud.power_watts),
+                    latency_ms, energy_j)
+
+    edge.current_load += float(edge_sizes.sum())
+    cloud.current_load += float(cloud_sizes.sum())
+    return latency_ms, energy_j
+
+
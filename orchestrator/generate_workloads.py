@@ -5,6 +5,9 @@ import random
 import math
 import os
 from datetime import datetime, timedelta
+from itertools import accumulate
+
+import numpy as np
 
 
 class WorkloadGenerator:
@@ -30,7 +33,8 @@ class WorkloadGenerator:
         self.out_dir = out_dir
         self.output_file = os.path.join(out_dir, "workloads.csv")
 
-        random.seed(self.random_seed)
+        # Private RNG, so seeding never touches the process-wide random state
+        self._random = random.Random(self.random_seed)
 
         # Define app profiles (size ranges in MB)
         self.app_profiles = {
@@ -38,43 +42,81 @@ class WorkloadGenerator:
             "ARVR": {"size_range": (5.0, 20.0), "priority_weights": {"low": 0.2, "medium": 0.5, "high": 0.3}},
             "VANET": {"size_range": (2.0, 8.0), "priority_weights": {"low": 0.3, "medium": 0.5, "high": 0.2}},
         }
+        # (priority names, cumulative weights) per app, for random.choices
+        self._priority_tables = {
+            app: (tuple(w), list(accumulate(w.values())))
+            for app, w in ((app, prof["priority_weights"]) for app, prof in self.app_profiles.items())
+        }
 
     # ---------------------------------------------------------------
     def _next_arrival_delta(self) -> float:
         """Generate next inter-arrival interval (seconds) using exponential distribution."""
-        return random.expovariate(self.poisson_lambda)
+        return self._random.expovariate(self.poisson_lambda)
 
     def _choose_priority(self, app_type: str) -> str:
-        weights = self.app_profiles[app_type]["priority_weights"]
-        return random.choices(list(weights.keys()), list(weights.values()))[0]
+        keys, cum = self._priority_tables[app_type]
+        return self._random.choices(keys, cum_weights=cum)[0]
 
     def _generate_task(self, task_id: int, current_time: datetime) -> tuple:
         """Create one realistic task event."""
-        app_type = random.choice(list(self.app_profiles.keys()))
+        app_type = self._random.choice(list(self.app_profiles.keys()))
         size_range = self.app_profiles[app_type]["size_range"]
-        size = random.uniform(*size_range)
+        size = self._random.uniform(*size_range)
         priority = self._choose_priority(app_type)
-        return (task_id, current_time.strftime("%Y-%m-%d %H:%M:%S"), app_type, round(size, 3), priority)
+        # isoformat gives the same "%Y-%m-%d %H:%M:%S" text as strftime, faster
+        timestamp = current_time.isoformat(" ", "seconds") if current_time.tzinfo is None \
+            else current_time.strftime("%Y-%m-%d %H:%M:%S")
+        return (task_id, timestamp, app_type, round(size, 3), priority)
 
     # ---------------------------------------------------------------
+    def _sample_columns(self) -> tuple:
+        """
+        Sample every task at once: (timestamps, app_types, sizes, priorities).
+        Each column is drawn with as few RNG calls as the random module allows.
+        """
+        rnd = self._random
+        n = self.num_tasks
+        apps = rnd.choices(list(self.app_profiles), k=n)
+
+        # Priorities: one choices() call per app over that app's tasks
+        priorities = [None] * n
+        for app, (keys, cum) in self._priority_tables.items():
+            idx = [i for i, a in enumerate(apps) if a == app]
+            for i, p in zip(idx, rnd.choices(keys, cum_weights=cum, k=len(idx))):
+                priorities[i] = p
+
+        ranges = {app: prof["size_range"] for app, prof in self.app_profiles.items()}
+        sizes = []
+        for a, u in zip(apps, (rnd.random() for _ in range(n))):
+            lo, hi = ranges[a]
+            sizes.append(round(lo + (hi - lo) * u, 3))
+
+        # Arrival gaps still come from self._random, so the seed fixes them;
+        # the cumulative sum and formatting run over the whole column in NumPy
+        expovariate, lam = rnd.expovariate, self.poisson_lambda
+        offsets = np.cumsum(np.fromiter((expovariate(lam) for _ in range(n)), dtype=np.float64, count=n))
+        base = self.base_time
+        if base.tzinfo is None:
+            times = np.datetime64(base, "us") + np.round(offsets * 1e6).astype("timedelta64[us]")
+            timestamps = np.char.replace(np.datetime_as_string(times, unit="s"), "T", " ").tolist()
+        else:
+            timestamps = [(base + timedelta(seconds=o)).strftime("%Y-%m-%d %H:%M:%S") for o in offsets.tolist()]
+        return timestamps, apps, sizes, priorities
+
     def generate(self) -> str:
         """Generate workloads.csv with timestamped tasks."""
         os.makedirs(self.out_dir, exist_ok=True)
-        current_time = self.base_time
-        tasks = []
+        timestamps, apps, sizes, priorities = self._sample_columns()
+        n = self.num_tasks
 
-        with open(self.output_file, "w", newline="") as f:
+        with open(self.output_file, "w", newline="", buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow(["task_id", "timestamp", "app_type", "size_mb", "priority"])
-            for i in range(self.num_tasks):
-                delta = self._next_arrival_delta()
-                current_time += timedelta(seconds=delta)
-                task = self._generate_task(i, current_time)
-                writer.writerow(task)
-                tasks.append(task)
-
-        print(f"[OK] Generated {len(tasks)} tasks -> {self.output_file}")
-        print(f"Example: {tasks[0]}")
+            writer.writerows(zip(range(n), timestamps, apps, sizes, priorities))
+
+        print(f"[OK] Generated {n} tasks -> {self.output_file}")
+        if n:
+            print(f"Example: {(0, timestamps[0], apps[0], sizes[0], priorities[0])}")
         return self.output_file
 
 
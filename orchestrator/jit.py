@@ -0,0 +1,22 @@
+# orchestrator/jit.py
+"""
+Optional Numba JIT support.
+
+Kernels are decorated with `njit` from here. When numba is not installed the
+decorator is a no-op and `prange` is plain `range`, so the same code runs as
+ordinary (slower) Python.
+"""
+from __future__ import annotations
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        # Supports both @njit and @njit(parallel=True, ...)
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
@@ -1,16 +1,22 @@
 # orchestrator/random_orchestrator.py
 from __future__ import annotations
-import random
+import numpy as np
 from orchestrator.environment import Node, Task
 
 class RandomOrchestrator:
     """Randomly assigns each task to edge or cloud."""
 
-    def __init__(self, edge: Node, cloud: Node):
+    def __init__(self, edge: Node, cloud: Node, seed=None):
         self.edge = edge
         self.cloud = cloud
+        # Private generator, so seeding never touches the global random state
+        self._rng = np.random.default_rng(seed)
+
+    def edge_mask(self, n: int) -> np.ndarray:
+        """Placements for n tasks in one draw: True where a task goes to edge."""
+        return self._rng.random(n) < 0.5
 
     def assign_task(self, task: Task):
-        node = self.edge if random.choice([True, False]) else self.cloud
+        node = self.edge if self._rng.random() < 0.5 else self.cloud
         latency = node.execute_task(task)
         return node.name, latency
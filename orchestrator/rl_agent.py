@@ -1,31 +1,35 @@
 # orchestrator/rl_agent.py
 import numpy as np
-import random
 
 class RLAgent:
     """
     Approximate Q-Learning agent for Edge/Cloud task placement.
     """
 
-    def __init__(self, learning_rate=0.1, discount_factor=0.9, epsilon=0.2):
+    def __init__(self, learning_rate=0.1, discount_factor=0.9, epsilon=0.2, seed=None):
         self.lr = learning_rate
         self.gamma = discount_factor
         self.epsilon = epsilon  # exploration probability
+        # one NumPy stream for initial weights and exploration (reproducible with seed)
+        self._rng = np.random.default_rng(seed)
         # weights for features (initialized small)
-        self.weights = np.random.uniform(-0.1, 0.1, 4)  # 4 input features
+        self.weights = self._rng.uniform(-0.1, 0.1, 4)  # 4 input features
+        self._feat = np.empty(4)  # reused by update() instead of a new array per step
 
-    def featurize(self, state):
+    def featurize(self, state, out=None):
         """
         Convert raw state to numeric feature vector.
         state = [latency_edge, latency_cloud, edge_load, task_size]
+        Writes into `out` when given, otherwise returns a new array.
         """
         latency_edge, latency_cloud, edge_load, task_size = state
-        return np.array([
-            latency_edge / 50.0,
-            latency_cloud / 50.0,
-            edge_load,
-            task_size / 10.0
-        ])
+        if out is None:
+            out = np.empty(4)
+        out[0] = latency_edge / 50.0
+        out[1] = latency_cloud / 50.0
+        out[2] = edge_load
+        out[3] = task_size / 10.0
+        return out
 
     def predict_q(self, features):
         """Compute Q-value approximation for both actions."""
@@ -34,26 +38,29 @@ class RLAgent:
 
     def choose_action(self, state):
         """ε-greedy policy."""
-        if random.random() < self.epsilon:
-            return random.choice([0, 1])  # explore
+        if self._rng.random() < self.epsilon:
+            return int(self._rng.integers(0, 2))  # explore
         q_edge = self.q_value(state, 0)
         q_cloud = self.q_value(state, 1)
         return 0 if q_edge > q_cloud else 1  # exploit
 
     def q_value(self, state, action):
         """Return predicted Q for the given action."""
-        features = self.featurize(state)
-        # Add simple action bias: if cloud, shift slightly
-        if action == 1:
-            features = features * 1.1
-        return self.predict_q(features)
+        latency_edge, latency_cloud, edge_load, task_size = state
+        w = self.weights
+        q = (w[0] * (latency_edge / 50.0) + w[1] * (latency_cloud / 50.0)
+             + w[2] * edge_load + w[3] * (task_size / 10.0))
+        # Add simple action bias: if cloud, shift slightly.
+        # NOTE: this makes Q(s, cloud) = 1.1 * Q(s, edge), so both actions share
+        # one linear model; per-action weights would need a redesign.
+        return q * 1.1 if action == 1 else q
 
     def update(self, state, action, reward, next_state):
         """Q-learning weight update."""
-        features = self.featurize(state)
+        features = self.featurize(state, out=self._feat)
         current_q = self.q_value(state, action)
         next_q_edge = self.q_value(next_state, 0)
         next_q_cloud = self.q_value(next_state, 1)
         target = reward + self.gamma * max(next_q_edge, next_q_cloud)
         td_error = target - current_q
-        self.weights += self.lr * td_error * features
+        self.weights += (self.lr * td_error) * features
@@ -1,11 +1,14 @@
 # orchestrator/rl_orchestrator.py
 from __future__ import annotations
-import random
+import functools
+import math
 import numpy as np
 from typing import Tuple, Optional
 
-from orchestrator.environment import Task, Node
-from orchestrator.sim_interface import NetworkSimulator
+from orchestrator.environment import Task, Node, _execute_cost
+from orchestrator import jit
+from orchestrator.jit import njit, prange
+from orchestrator.sim_interface import NetworkSimulator, FiveGDistributedSimulator, _fiveg_latency_one, _LOAD_SCALE
 
 # Import safe print utility
 try:
@@ -22,6 +25,55 @@ except ImportError:
 
 
 
+# State encodings shared by _get_state_raw and array-based callers (main.py)
+APP_INDEX = {"iot": 0, "arvr": 1, "vanet": 2}
+PRIORITY_INDEX = {"low": 0, "medium": 1, "high": 2}
+_APP_NAMES = ("IoT", "ARVR", "VANET")
+_PRIORITY_NAMES = ("low", "medium", "high")
+
+# Training task profiles, indexed by app_idx - aligned with WorkloadGenerator
+_TRAIN_SIZE_RANGES = np.array([[0.5, 3.0], [5.0, 12.0], [2.0, 8.0]])
+_TRAIN_PRIORITY_CUM = np.cumsum([[0.6, 0.3, 0.1], [0.2, 0.5, 0.3], [0.3, 0.5, 0.2]], axis=1)
+
+
+def cosh_epsilon(k: int, eps0: float, horizon: int, a: float = 0.3, b: float = 0.2,
+                 c: float = 0.1, eps_at_horizon: Optional[float] = None) -> float:
+    """
+    Cosh-shaped exploration schedule for episode k (1-based).
+    
+    Stays close to eps0 for roughly the first a*horizon episodes, then falls
+    off over a window set by b, with a linear drift c. Past the horizon it
+    decays as eps_at_horizon / (k - horizon).
+    """
+    if k <= horizon:
+        return eps0 - (0.9 * eps0 / math.cosh(math.exp(-(k - a * horizon) / (b * horizon))) + k * c / horizon)
+    if eps_at_horizon is None:
+        eps_at_horizon = max(0.0, cosh_epsilon(horizon, eps0, horizon, a, b, c))
+    return eps_at_horizon / (k - horizon)
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_task(app_type: str, priority: str) -> Tuple[int, int]:
+    """(app_idx, prio_idx) for a task's labels; unknown labels map to 0."""
+    return APP_INDEX.get(app_type.lower(), 0), PRIORITY_INDEX.get(priority.lower(), 0)
+
+
+@njit(cache=True)
+def _load_norm(edge_load: float, cloud_load: float) -> float:
+    """Mean node load scaled to [0, 1] (100 MB = fully loaded)."""
+    return min(1.0, max(0.0, (edge_load + cloud_load) / 200.0))
+
+
+@njit(cache=True)
+def _aql_reward(latency_ms: float, energy_j: float, w_latency: float, w_energy: float) -> float:
+    """
+    Multi-objective reward (latency + energy).
+    Normalize values roughly: Latency in ms (~10-100), Energy in J (~0.1-5)
+    Reward = - (Latency/100 + Energy)
+    """
+    return -((latency_ms / 100.0) * w_latency + energy_j * w_energy)
+
+
 # ---------------------------------------------------------------------
 # Feature Extractor for AQL
 # ---------------------------------------------------------------------
@@ -35,29 +87,184 @@ class FeatureExtractor:
     4. Task Size (scaled)
     5. Priority (one-hot or scaled)
     """
-    def get_features(self, state: tuple, action: int, cloud_idx: int = 1) -> np.ndarray:
-        # State: (app_type, priority, size_category, load_category, raw_size, raw_load)
-        # We need raw values for better approximation, so we'll adjust _get_state first.
-        # However, to keep signature compatible, we'll parse the tuple or expect enhanced state.
-        
-        # Unpack simplified state for now (assuming we update _get_state to return raw vals too)
-        # For this implementation, we will assume state contains:
-        # (app_type_idx, priority_idx, size_mb, current_load_norm)
-        
+
+    def get_features(self, state: tuple, action: int, cloud_idx: int = 1) -> tuple:
+        # State: (app_type_idx, priority_idx, size_mb, current_load_norm)
         app_idx, prio_idx, size_mb, load_norm = state
         
-        # Feature vector size: 6
+        # Feature vector size: 6, as plain floats (no per-call array)
         # [Bias, Is_Cloud, Size, Load, Size*Load, Priority]
-        features = np.zeros(6)
+        size_s = size_mb / 10.0 # Scale
+        return (
+            1.0, # Bias
+            1.0 if action == cloud_idx else 0.0,
+            size_s,
+            load_norm,
+            size_s * load_norm, # Interaction term
+            prio_idx / 2.0, # 0, 0.5, 1.0
+        )
+
+# ---------------------------------------------------------------------
+# Compiled AQL step (same features as FeatureExtractor, in scalars)
+# ---------------------------------------------------------------------
+@njit(cache=True, fastmath=True)
+def _aql_q(weights, action, size_mb, load_norm, prio_idx):
+    """weights . FeatureExtractor.get_features((_, prio_idx, size_mb, load_norm), action)"""
+    size_s = size_mb / 10.0
+    return (weights[0]
+            + weights[1] * (1.0 if action == 1 else 0.0)
+            + weights[2] * size_s
+            + weights[3] * load_norm
+            + weights[4] * size_s * load_norm
+            + weights[5] * prio_idx / 2.0)
+
+
+@njit(cache=True, fastmath=True)
+def _aql_greedy(weights):
+    """
+    choose_action_greedy for every state: edge (0) unless cloud has the
+    strictly higher Q. Q(s, cloud) - Q(s, edge) == weights[1] whatever s is.
+    """
+    return 1 if weights[1] > 0.0 else 0
+
+
+@njit(cache=True, fastmath=True)
+def _aql_update(weights, prio_idx, size_mb, load_norm, action, reward,
+                next_prio_idx, next_size_mb, next_load_norm, alpha, gamma):
+    """update_q in place on `weights`."""
+    # max_a Q(s', a): the cloud action only adds weights[1]
+    q_next_max = _aql_q(weights, 0, next_size_mb, next_load_norm, next_prio_idx) + max(weights[1], 0.0)
+    td_error = reward + gamma * q_next_max - _aql_q(weights, action, size_mb, load_norm, prio_idx)
+    step = alpha * td_error
+    size_s = size_mb / 10.0
+    weights[0] += step
+    weights[1] += step * (1.0 if action == 1 else 0.0)
+    weights[2] += step * size_s
+    weights[3] += step * load_norm
+    weights[4] += step * size_s * load_norm
+    weights[5] += step * prio_idx / 2.0
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _aql_replay_update(weights, idx, prio, size, load, action, reward,
+                       next_prio, next_size, next_load, alpha, gamma):
+    """One gradient step on `weights` with the mean TD gradient of the replayed transitions idx."""
+    g0 = g1 = g2 = g3 = g4 = g5 = 0.0
+    for j in prange(idx.shape[0]):
+        t = idx[j]
+        q_next_max = _aql_q(weights, 0, next_size[t], next_load[t], next_prio[t]) + max(weights[1], 0.0)
+        td_error = reward[t] + gamma * q_next_max - _aql_q(weights, action[t], size[t], load[t], prio[t])
+        size_s = size[t] / 10.0
+        g0 += td_error
+        g1 += td_error * (1.0 if action[t] == 1 else 0.0)
+        g2 += td_error * size_s
+        g3 += td_error * load[t]
+        g4 += td_error * size_s * load[t]
+        g5 += td_error * prio[t] / 2.0
+    step = alpha / idx.shape[0]
+    weights[0] += step * g0
+    weights[1] += step * g1
+    weights[2] += step * g2
+    weights[3] += step * g3
+    weights[4] += step * g4
+    weights[5] += step * g5
+
+
+@njit(cache=True, fastmath=True)
+def _aql_fiveg_episode(weights, prios, sizes, explore, explore_action,
+                       fading, interference, backbone, base_edge_ms, base_cloud_ms,
+                       edge_proc_ms_per_mb, cloud_proc_ms_per_mb,
+                       edge_energy_j_per_mb, cloud_energy_j_per_mb, edge_power, cloud_power,
+                       w_latency, w_energy, alpha, gamma,
+                       rp_prio, rp_size, rp_load, rp_action, rp_reward,
+                       rp_next_prio, rp_next_size, rp_next_load, rp_pos, rp_size_used, replay_u,
+                       out_latency, out_energy, out_reward):
+    """
+    One training episode of simulate_environment against FiveGDistributedSimulator,
+    with its channel noise pre-drawn. Replay is skipped when replay_u has no columns.
+    Each step's latency, energy and reward go to out_latency/out_energy/out_reward.
+    Returns (edge_load, cloud_load, rp_pos, rp_size_used).
+    """
+    n = explore.shape[0]
+    batch = replay_u.shape[1]
+    capacity = rp_prio.shape[0]
+    idx = np.empty(batch, dtype=np.int64)
+    edge_load = 0.0
+    cloud_load = 0.0
+    for i in range(n):
+        size_mb = sizes[i]
+        load_norm = _load_norm(edge_load, cloud_load)
+        if explore[i]:
+            action = explore_action[i]
+        else:
+            action = _aql_greedy(weights)
         
-        features[0] = 1.0 # Bias
-        features[1] = 1.0 if action == cloud_idx else 0.0
-        features[2] = size_mb / 10.0 # Scale
-        features[3] = load_norm
-        features[4] = (size_mb / 10.0) * load_norm # Interaction term
-        features[5] = prio_idx / 2.0 # 0, 0.5, 1.0
+        # Node.execute with FiveGDistributedSimulator.simulate_latency
+        if action == 0:
+            net_ms = _fiveg_latency_one(True, edge_load * _LOAD_SCALE, size_mb, fading[i], interference[i],
+                                        backbone[i], base_edge_ms, base_cloud_ms)
+            latency, energy = _execute_cost(size_mb, net_ms / 1000.0, edge_proc_ms_per_mb,
+                                            edge_energy_j_per_mb, edge_power)
+            edge_load += size_mb
+        else:
+            net_ms = _fiveg_latency_one(False, cloud_load * _LOAD_SCALE, size_mb, fading[i], interference[i],
+                                        backbone[i], base_edge_ms, base_cloud_ms)
+            latency, energy = _execute_cost(size_mb, net_ms / 1000.0, cloud_proc_ms_per_mb,
+                                            cloud_energy_j_per_mb, cloud_power)
+            cloud_load += size_mb
         
-        return features
+        reward = _aql_reward(latency, energy, w_latency, w_energy)
+        next_load_norm = _load_norm(edge_load, cloud_load)
+        _aql_update(weights, prios[i], size_mb, load_norm, action, reward,
+                    prios[i + 1], sizes[i + 1], next_load_norm, alpha, gamma)
+        
+        if batch > 0:
+            rp_prio[rp_pos] = prios[i]
+            rp_size[rp_pos] = size_mb
+            rp_load[rp_pos] = load_norm
+            rp_action[rp_pos] = action
+            rp_reward[rp_pos] = reward
+            rp_next_prio[rp_pos] = prios[i + 1]
+            rp_next_size[rp_pos] = sizes[i + 1]
+            rp_next_load[rp_pos] = next_load_norm
+            rp_pos = (rp_pos + 1) % capacity
+            rp_size_used = min(rp_size_used + 1, capacity)
+            for j in range(batch):
+                idx[j] = min(int(replay_u[i, j] * rp_size_used), rp_size_used - 1)
+            _aql_replay_update(weights, idx, rp_prio, rp_size, rp_load, rp_action, rp_reward,
+                               rp_next_prio, rp_next_size, rp_next_load, alpha, gamma)
+        
+        out_latency[i] = latency
+        out_energy[i] = energy
+        out_reward[i] = reward
+    return edge_load, cloud_load, rp_pos, rp_size_used
+
+
+class _ReplayBuffer:
+    """Fixed-capacity ring of AQL transitions, one NumPy column per field."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.size = 0
+        self._pos = 0
+        self.prio = np.zeros(capacity, dtype=np.int64)
+        self.size_mb = np.zeros(capacity)
+        self.load = np.zeros(capacity)
+        self.action = np.zeros(capacity, dtype=np.int64)
+        self.reward = np.zeros(capacity)
+        self.next_prio = np.zeros(capacity, dtype=np.int64)
+        self.next_size_mb = np.zeros(capacity)
+        self.next_load = np.zeros(capacity)
+
+    def add(self, state: tuple, action: int, reward: float, next_state: tuple) -> None:
+        i = self._pos
+        self.prio[i], self.size_mb[i], self.load[i] = state[1], state[2], state[3]
+        self.action[i] = action
+        self.reward[i] = reward
+        self.next_prio[i], self.next_size_mb[i], self.next_load[i] = next_state[1], next_state[2], next_state[3]
+        self._pos = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
 
 class RLBasedOrchestrator:
     """"
@@ -75,6 +282,10 @@ class RLBasedOrchestrator:
         epsilon: float = 0.3,
         alpha: float = 0.01, # Smaller alpha for AQL
         gamma: float = 0.9,
+        seed: Optional[int] = None,
+        epsilon_horizon: Optional[int] = None,
+        replay_batch: int = 32,
+        replay_capacity: int = 50_000,
     ):
         # Default edge/cloud nodes
         self.edge = edge or Node(0, "edge", 2.0)
@@ -88,6 +299,15 @@ class RLBasedOrchestrator:
         self.epsilon = epsilon
         self.alpha = alpha
         self.gamma = gamma
+        # Episodes over which epsilon follows the cosh schedule (default: all)
+        self.epsilon_horizon = epsilon_horizon or episodes
+        self.min_epsilon = 0.05
+        # Experience replay: extra minibatch updates per step (0 disables)
+        self.replay_batch = replay_batch
+        self.replay_capacity = replay_capacity
+        # All exploration and training-task draws come from this one stream
+        # (reproducible with seed; never touches the global random module)
+        self._rng = np.random.default_rng(seed)
         
         # AQL: Weights vector instead of Q-Table
         # Features: 6 dimensions
@@ -111,20 +331,13 @@ class RLBasedOrchestrator:
         Returns raw state values for feature extraction.
         (app_idx, prio_idx, size_mb, load_norm)
         """
-        app_map = {"iot": 0, "arvr": 1, "vanet": 2}
-        prio_map = {"low": 0, "medium": 1, "high": 2}
-        
-        app_idx = app_map.get(task.app_type.lower(), 0)
-        prio_idx = prio_map.get(task.priority.lower(), 0)
-        
-        avg_load = (edge_load + cloud_load) / 2.0
-        load_norm = min(1.0, max(0.0, avg_load / 100.0))
-        
-        return (app_idx, prio_idx, task.size_mb, load_norm)
+        app_idx, prio_idx = _encode_task(task.app_type, task.priority)
+        return (app_idx, prio_idx, task.size_mb, _load_norm(edge_load, cloud_load))
 
     def _get_q(self, state: tuple, action: int) -> float:
-        features = self.feature_extractor.get_features(state, action)
-        return np.dot(self.weights, features)
+        f0, f1, f2, f3, f4, f5 = self.feature_extractor.get_features(state, action)
+        w = self.weights
+        return float(w[0] * f0 + w[1] * f1 + w[2] * f2 + w[3] * f3 + w[4] * f4 + w[5] * f5)
 
     def _get_state(self, task: Task, edge_load: float = 0.0, cloud_load: float = 0.0) -> tuple:
         # Legacy support wrapper if needed, but we use raw mostly
@@ -142,13 +355,20 @@ class RLBasedOrchestrator:
         latency, energy = node.execute_task(task, network_sim=self.sim)
         return (node.name, latency, energy)
 
+    def assign_and_execute_raw(self, app_idx: int, prio_idx: int, size_mb: float, action: int) -> Tuple[str, float, float]:
+        """assign_and_execute on encoded task fields, without building a Task."""
+        node = self.edge if action == 0 else self.cloud
+        latency, energy = node.execute(size_mb, _APP_NAMES[app_idx], network_sim=self.sim)
+        return (node.name, latency, energy)
+
     def choose_action(self, state: tuple) -> int:
         """ε-greedy policy."""
-        if random.random() < self.epsilon:
-            return random.choice([0, 1])
-        q_edge = self._get_q(state, 0)
-        q_cloud = self._get_q(state, 1)
-        return 0 if q_edge >= q_cloud else 1
+        # One draw decides both: given u < ε, u is uniform on [0, ε), so
+        # u >= ε/2 (i.e. 2u >= ε) is a fair coin for edge vs cloud
+        u = self._rng.random()
+        if u < self.epsilon:
+            return int(2.0 * u >= self.epsilon)
+        return self.choose_action_greedy(state)
 
     def choose_action_greedy(self, state: tuple) -> int:
         """Greedy policy (always exploit) for evaluation."""
@@ -156,10 +376,25 @@ class RLBasedOrchestrator:
         q_cloud = self._get_q(state, 1)
         return 0 if q_edge >= q_cloud else 1
 
+    def state_free_greedy_action(self) -> Optional[int]:
+        """
+        The greedy action shared by every state, or None if there is none.
+        
+        With FeatureExtractor itself the action only enters through the
+        Is_Cloud indicator, so Q(s, cloud) - Q(s, edge) is the same for every
+        state and one action is greedy everywhere. Returns None for any other
+        extractor, subclasses included.
+        """
+        if type(self.feature_extractor) is not FeatureExtractor:
+            return None
+        return self.choose_action_greedy((0, 0, 0.0, 0.0))
+
     def update_q(self, state: tuple, action: int, reward: float, next_state: tuple):
         """AQL Gradient Descent Update."""
         # Target = R + gamma * max_a(Q(s', a))
-        q_next_max = max(self._get_q(next_state, a) for a in [0, 1])
+        q_next_edge = self._get_q(next_state, 0)
+        q_next_cloud = self._get_q(next_state, 1)
+        q_next_max = q_next_edge if q_next_edge >= q_next_cloud else q_next_cloud
         target = reward + self.gamma * q_next_max
         
         # Prediction = Q(s, a)
@@ -169,87 +404,160 @@ class RLBasedOrchestrator:
         td_error = target - prediction
         
         # Gradient Update: w <- w + alpha * error * features
-        features = self.feature_extractor.get_features(state, action)
-        self.weights += self.alpha * td_error * features
+        step = self.alpha * td_error
+        w = self.weights
+        for j, f in enumerate(self.feature_extractor.get_features(state, action)):
+            w[j] += step * f
 
     # ------------------------------------------------------------------
     # Training loop
     # ------------------------------------------------------------------
+    def _sample_episode_tasks(self, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Draw n training tasks at once as (app_idx, prio_idx, size_mb) arrays."""
+        apps = self._rng.integers(0, len(_APP_NAMES), n)
+        lo, hi = _TRAIN_SIZE_RANGES[apps, 0], _TRAIN_SIZE_RANGES[apps, 1]
+        sizes = np.round(lo + self._rng.random(n) * (hi - lo), 3)
+        u = self._rng.random(n)
+        prios = np.minimum((u[:, None] >= _TRAIN_PRIORITY_CUM[apps]).sum(axis=1), len(_PRIORITY_NAMES) - 1)
+        return apps, prios, sizes
+
+    def _run_fiveg_episode(self, prios, sizes, explore, explore_action, replay) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Run one episode through _aql_fiveg_episode; returns per-step (latency, energy, reward) arrays."""
+        sim, edge, cloud = self.sim, self.edge, self.cloud
+        fading, interference, backbone = sim.draw_channel_noise(len(explore))
+        if replay is None:
+            replay = _ReplayBuffer(1)
+            replay_u = np.empty((len(explore), 0))
+        else:
+            replay_u = self._rng.random((len(explore), self.replay_batch))
+        latency, energy, reward = np.empty(len(explore)), np.empty(len(explore)), np.empty(len(explore))
+        
+        edge_load, cloud_load, replay._pos, replay.size = _aql_fiveg_episode(
+            self.weights, prios, sizes, explore, explore_action,
+            fading, interference, backbone, float(sim.base_edge_ms), float(sim.base_cloud_ms),
+            edge._proc_ms_per_mb, cloud._proc_ms_per_mb,
+            edge._energy_j_per_mb, cloud._energy_j_per_mb,
+            float(edge.power_watts), float(cloud.power_watts),
+            float(self.w_latency), float(self.w_energy), float(self.alpha), float(self.gamma),
+            replay.prio, replay.size_mb, replay.load, replay.action, replay.reward,
+            replay.next_prio, replay.next_size_mb, replay.next_load, replay._pos, replay.size, replay_u,
+            latency, energy, reward,
+        )
+        edge.current_load += edge_load
+        cloud.current_load += cloud_load
+        return latency, energy, reward
+
     def simulate_environment(self, num_tasks: int = 300):
         """Runs AQL training."""
         safe_print("[START] Starting AQL Simulation (Proposal Aligned)...", fallback="[START] Starting AQL Simulation...")
-        total_rewards: list[float] = []
+        if not jit.NUMBA_AVAILABLE:
+            # Same algorithm either way; only the kernels run as plain Python
+            print("[WARN] numba not installed - training kernels run as pure Python (slow)")
+        total_rewards = np.empty(self.episodes)  # one slot per episode
+        avg_latency = 0.0
+        eps0, alpha0 = self.epsilon, self.alpha
+        horizon = self.epsilon_horizon
+        eps_at_horizon = max(self.min_epsilon, cosh_epsilon(horizon, eps0, horizon))
+        # The compiled step hard-codes FeatureExtractor's features
+        compiled = type(self.feature_extractor) is FeatureExtractor
+        if compiled:
+            self.weights = np.ascontiguousarray(self.weights, dtype=np.float64)
+        # Replay reuses the compiled features, so it needs the stock extractor
+        replay = _ReplayBuffer(self.replay_capacity) if compiled and self.replay_batch > 0 else None
+        # With the stock 5G simulator the whole episode runs in one compiled call
+        episode_kernel = compiled and type(self.sim) is FiveGDistributedSimulator
 
-        for ep in range(self.episodes):
-            episode_reward = 0.0
-            self.edge.reset_load()
-            self.cloud.reset_load()
+        # The schedule runs on self.epsilon/self.alpha (the update paths read
+        # them); the constructor values are restored afterwards, so every
+        # call starts from the same schedule
+        try:
+            for ep in range(self.episodes):
+                episode_reward = 0.0
+                latency_sum = 0.0  # running sum; no per-task list
+                self.edge.reset_load()
+                self.cloud.reset_load()
             
-            for i in range(num_tasks):
-                # Generate Task - Aligned with WorkloadGenerator
-                app = random.choice(["IoT", "ARVR", "VANET"])
-                prio_map = {"IoT": ["low"]*6 + ["medium"]*3 + ["high"]*1,
-                           "ARVR": ["low"]*2 + ["medium"]*5 + ["high"]*3,
-                           "VANET": ["low"]*3 + ["medium"]*5 + ["high"]*2}
-                prio = random.choice(prio_map[app])
-                
-                # Size ranges from report
-                if app == "IoT": size = random.uniform(0.5, 3.0)
-                elif app == "ARVR": size = random.uniform(5.0, 12.0)
-                else: size = random.uniform(2.0, 8.0)
-                
-                task = Task(i, app, round(size, 3), prio)
-
-                state = self._get_state_raw(task, self.edge.current_load, self.cloud.current_load)
-                action = self.choose_action(state)
+                # ε-greedy draws for the whole episode in one call (split as in choose_action)
+                u = self._rng.random(num_tasks)
+                explore = u < self.epsilon
+                explore_action = (2.0 * u >= self.epsilon).astype(np.int64)
+            
+                # Episode tasks, plus one more so task i+1 is the next state of task i
+                apps, prios, sizes = self._sample_episode_tasks(num_tasks + 1)
+            
+                if episode_kernel:
+                    latency, _, reward = self._run_fiveg_episode(prios, sizes, explore, explore_action, replay)
+                    episode_reward, latency_sum = float(reward.sum()), float(latency.sum())
+                    num_steps = 0  # skip the per-step loop below
+                else:
+                    num_steps = num_tasks
+                    apps, prios, sizes = apps.tolist(), prios.tolist(), sizes.tolist()
+                    explore, explore_action = explore.tolist(), explore_action.tolist()
+            
+                for i in range(num_steps):
+                    state = (apps[i], prios[i], sizes[i],
+                             _load_norm(self.edge.current_load, self.cloud.current_load))
+                    if explore[i]:
+                        action = int(explore_action[i])
+                    elif compiled:
+                        action = _aql_greedy(self.weights)
+                    else:
+                        action = self.choose_action_greedy(state)
                 
-                # Execute
-                _, latency, energy = self.assign_and_execute(task, action)
+                    # Execute
+                    _, latency, energy = self.assign_and_execute_raw(apps[i], prios[i], sizes[i], action)
 
-                # Reward: Multi-objective (Latency + Energy)
-                # Normalize values roughly: Latency in ms (~10-100), Energy in J (~0.1-5)
-                # Reward = - (Latency/100 + Energy)
-                reward = - ( (latency / 100.0) * self.w_latency + energy * self.w_energy )
+                    # Reward: Multi-objective (Latency + Energy)
+                    reward = _aql_reward(latency, energy, self.w_latency, self.w_energy)
                 
-                # Next State
-                next_app = random.choice(["IoT", "ARVR", "VANET"])
-                if next_app == "IoT": next_size = random.uniform(0.5, 3.0)
-                elif next_app == "ARVR": next_size = random.uniform(5.0, 12.0)
-                else: next_size = random.uniform(2.0, 8.0)
-                next_prio = random.choice(prio_map[next_app])
+                    # Next State: the next task in the episode, seen at post-execution loads
+                    next_state = (apps[i + 1], prios[i + 1], sizes[i + 1],
+                                  _load_norm(self.edge.current_load, self.cloud.current_load))
                 
-                next_task = Task(i+1, next_app, round(next_size, 3), next_prio)
-                next_state = self._get_state_raw(next_task, self.edge.current_load, self.cloud.current_load)
-                
-                self.update_q(state, action, reward, next_state)
-                episode_reward += reward
+                    if compiled:
+                        _aql_update(self.weights, state[1], state[2], state[3], action, reward,
+                                    next_state[1], next_state[2], next_state[3], self.alpha, self.gamma)
+                        if replay is not None:
+                            replay.add(state, action, reward, next_state)
+                            idx = self._rng.integers(0, replay.size, self.replay_batch)
+                            _aql_replay_update(self.weights, idx, replay.prio, replay.size_mb, replay.load,
+                                               replay.action, replay.reward, replay.next_prio,
+                                               replay.next_size_mb, replay.next_load, self.alpha, self.gamma)
+                    else:
+                        self.update_q(state, action, reward, next_state)
+                    episode_reward += reward
+                    latency_sum += latency
 
-            total_rewards.append(episode_reward)
-            self.epsilon = max(0.05, self.epsilon * 0.99)
+                total_rewards[ep] = episode_reward
+                avg_latency = latency_sum / num_tasks if num_tasks else 0.0
+                # Exploration follows the cosh schedule; the step size decays harmonically
+                k = ep + 1
+                self.epsilon = max(self.min_epsilon, cosh_epsilon(k, eps0, horizon, eps_at_horizon=eps_at_horizon))
+                self.alpha = alpha0 / (1.0 + k / horizon)
 
-            if (ep + 1) % 20 == 0:
-                avg_r = np.mean(total_rewards[-20:])
-                print(f"Episode {ep+1:3d}/{self.episodes} | Avg reward (last 20): {avg_r:.2f}")
+                if (ep + 1) % 20 == 0:
+                    avg_r = total_rewards[max(0, ep - 19):ep + 1].mean()
+                    print(f"Episode {ep+1:3d}/{self.episodes} | Avg reward (last 20): {avg_r:.2f}")
+        finally:
+            self.epsilon, self.alpha = eps0, alpha0
 
         safe_print("[OK] AQL training completed.", fallback="[OK] AQL training completed.")
-        return 0, total_rewards # Return dummy latency for signature compat
+        return avg_latency, total_rewards # Mean latency (ms) of the final episode
 
     # ------------------------------------------------------------------
     # Persistence utilities
     # ------------------------------------------------------------------
     def save_weights(self, path: str) -> None:
-        np.save(path, self.weights, allow_pickle=True)
+        np.save(path, np.asarray(self.weights, dtype=np.float64), allow_pickle=False)
         safe_print(f"[SAVE] Saved AQL weights -> {path}", fallback=f"[SAVE] Saved AQL weights -> {path}")
 
     def load_weights(self, path: str) -> bool:
         try:
-            self.weights = np.load(path, allow_pickle=True)
+            weights = np.load(path, allow_pickle=False)
+            if weights.shape != self.weights.shape:
+                return False
+            self.weights = weights.astype(np.float64, copy=False)
             safe_print(f"[LOAD] Loaded AQL weights from {path}", fallback=f"[LOAD] Loaded AQL weights from {path}")
             return True
         except Exception:
             return False
-
-def get_simulator(sim_type: str) -> NetworkSimulator:
-    """Factory to get the desired simulator instance."""
-    from orchestrator.sim_interface import get_simulator as factory_get
-    return factory_get(sim_type)
\ No newline at end of file
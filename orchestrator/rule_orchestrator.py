@@ -10,7 +10,7 @@ class RuleBasedOrchestrator:
         self.cloud = cloud
 
     def assign_task(self, task: Task):
-        if task.size_mb < 5.0 or task.priority.lower() == "high":
+        if task.size_mb < 5.0 or task.priority == "high":
             node = self.edge
         else:
             node = self.cloud
@@ -1,7 +1,76 @@
 # orchestrator/sim_interface.py
 from __future__ import annotations
-import random
+import functools
 import math
+import time
+
+import numpy as np
+
+from orchestrator.jit import njit, prange
+
+# Integer node-type flags; latency_ms accepts these in place of a node-type name
+NODE_EDGE = 0
+NODE_CLOUD = 1
+
+
+@functools.lru_cache(maxsize=32)
+def _is_edge_name(node_type: str) -> bool:
+    return "edge" in node_type.lower()
+
+
+def _is_edge(node_type) -> bool:
+    """True for NODE_EDGE or a node-type name containing "edge" (any case)."""
+    if isinstance(node_type, str):
+        return _is_edge_name(node_type)
+    return node_type == NODE_EDGE
+
+
+def _edge_mask(is_edge) -> np.ndarray:
+    """
+    Boolean edge mask for the batch APIs. Accepts a boolean mask,
+    NODE_EDGE/NODE_CLOUD flags or node-type names (matched like _is_edge).
+    """
+    a = np.asarray(is_edge)
+    if a.dtype.kind == "b":
+        return a
+    if a.dtype.kind in "iu":
+        return a == NODE_EDGE
+    if a.dtype.kind in "UO":
+        # Resolve each distinct name once
+        names, inverse = np.unique(a.astype(str), return_inverse=True)
+        return np.array([_is_edge_name(name) for name in names], dtype=np.bool_)[inverse].reshape(a.shape)
+    return a.astype(np.bool_)
+
+
+# The node types Node actually passes, resolved with one hash lookup; anything
+# else falls back to _is_edge. Simulators inline `_NODE_IS_EDGE.get(t)` rather
+# than calling a helper, since the call itself costs more than the lookup.
+_NODE_IS_EDGE = {"edge": True, "cloud": False, NODE_EDGE: True, NODE_CLOUD: False}
+
+# bools hash like 0/1, so True would hit NODE_CLOUD above, the opposite of
+# what True means in the batch APIs' is_edge masks; the scalar APIs reject them
+_BOOL_TYPES = (bool, np.bool_)
+_BOOL_NODE_MSG = "node_type must be a node-type name or NODE_EDGE/NODE_CLOUD, not a bool"
+
+
+# node_load (MB) -> normalised load, assuming a 100 MB node capacity
+_LOAD_SCALE = 1.0 / 100.0
+
+_NOISE_BLOCK = 4096  # scalar latency paths refill their noise buffers this many at a time
+
+# NetworkSimulator app jitter ranges in seconds: (low, high) per upper-cased app type
+_APP_JITTER_S = {
+    "IOT": (0.0001, 0.0005),
+    "ARVR": (0.001, 0.002),
+    "VANET": (0.0005, 0.001),
+}
+_DEFAULT_JITTER_S = (0.0001, 0.001)
+
+
+@functools.lru_cache(maxsize=32)
+def _app_jitter_bounds(app_type: str) -> tuple:
+    """(low, high) jitter in seconds for an app type, resolved once per name."""
+    return _APP_JITTER_S.get(str(app_type).upper(), _DEFAULT_JITTER_S)
 
 # ---------------------------------------------------------------------
 # Base abstract simulator
@@ -12,12 +81,25 @@ class NetworkSimulator:
     Produces realistic latency behavior for 5G, Wi-Fi, or backhaul.
     """
 
-    def __init__(self, base_edge_latency=0.002, base_cloud_latency=0.008):
+    def __init__(self, base_edge_latency=0.002, base_cloud_latency=0.008, seed=None):
         """
         Latencies are in seconds internally (ms when multiplied by 1000).
+        seed seeds this simulator's own generator; the global random module
+        is never touched.
         """
         self.base_edge_latency = base_edge_latency
         self.base_cloud_latency = base_cloud_latency
+        self._rng = np.random.default_rng(seed)
+        self._uniform_buf: list[float] = []
+
+    def _next_uniform(self) -> float:
+        """Next U[0, 1) draw for the scalar path, served from a pre-drawn block."""
+        if not self._uniform_buf:
+            self._uniform_buf = self._rng.random(_NOISE_BLOCK).tolist()
+        return self._uniform_buf.pop()
+
+    def flush_delay(self) -> None:
+        """Finish any emulated wall-clock delay still owed; a no-op for models without one."""
 
     def simulate_latency(self, node_type: str, app_type: str, task_size_mb: float = 1.0, node_load: float = 0.0) -> float:
         """
@@ -32,27 +114,70 @@ class NetworkSimulator:
         Returns:
             Latency in seconds
         """
-        node = str(node_type).lower()
+        if node_type.__class__ in _BOOL_TYPES:
+            raise TypeError(_BOOL_NODE_MSG)
+        on_edge = _NODE_IS_EDGE.get(node_type)
+        if on_edge is None:
+            on_edge = str(node_type).lower() in ("edge", "0")
 
         # --- base latency ---
-        if node in ("edge", "0"):
+        if on_edge:
             base = self.base_edge_latency
         else:
             base = self.base_cloud_latency
 
         # --- app-specific jitter ---
-        app = app_type.upper()
-        if app == "IOT":
-            jitter = random.uniform(0.0001, 0.0005)
-        elif app == "ARVR":
-            jitter = random.uniform(0.001, 0.002)
-        elif app == "VANET":
-            jitter = random.uniform(0.0005, 0.001)
-        else:
-            jitter = random.uniform(0.0001, 0.001)
+        lo, hi = _app_jitter_bounds(app_type)
+        jitter = lo + (hi - lo) * self._next_uniform()
 
         return base + jitter
 
+    def simulate_latency_batch(self, is_edge, task_size_mb, node_load, app_types=None) -> np.ndarray:
+        """
+        Batched simulate_latency for tasks on edge (is_edge True) or cloud nodes.
+        
+        This base model is evaluated with array math. Subclasses that only
+        override simulate_latency get one simulate_latency call per task;
+        simulators with a closed-form model override this method instead.
+        
+        Returns:
+            Latencies in seconds
+        """
+        is_edge = _edge_mask(is_edge)
+        sizes = np.asarray(task_size_mb, dtype=np.float64)
+        loads = np.asarray(node_load, dtype=np.float64)
+        if type(self).simulate_latency is NetworkSimulator.simulate_latency:
+            return self._base_latency_batch(is_edge, app_types)
+        if app_types is None:
+            app_types = [""] * len(sizes)
+        # Call the override the way Node.execute would (environment imports
+        # this module, so the helper is imported here)
+        from orchestrator.environment import _sim_signature_kind
+        if _sim_signature_kind(type(self)) == "basic":
+            latencies = (
+                self.simulate_latency("edge" if e else "cloud", app)
+                for e, app in zip(is_edge, app_types)
+            )
+        else:
+            latencies = (
+                self.simulate_latency("edge" if e else "cloud", app, task_size_mb=float(s), node_load=float(l))
+                for e, app, s, l in zip(is_edge, app_types, sizes, loads)
+            )
+        return np.fromiter(latencies, dtype=np.float64, count=len(sizes))
+
+
+    def _base_latency_batch(self, is_edge, app_types) -> np.ndarray:
+        """simulate_latency's base + app jitter model over a batch, in seconds."""
+        n = is_edge.shape[0]
+        lo = np.full(n, _DEFAULT_JITTER_S[0])
+        hi = np.full(n, _DEFAULT_JITTER_S[1])
+        if app_types is not None and n:
+            names, inverse = np.unique(np.asarray(app_types, dtype=str), return_inverse=True)
+            bounds = np.array([_app_jitter_bounds(name) for name in names])
+            lo, hi = bounds[inverse, 0], bounds[inverse, 1]
+        jitter = lo + self._rng.random(n) * (hi - lo)
+        return np.where(is_edge, self.base_edge_latency, self.base_cloud_latency) + jitter
+
 
 # ---------------------------------------------------------------------
 # Simple built-in simulator
@@ -60,6 +185,32 @@ class NetworkSimulator:
 # ---------------------------------------------------------------------
 # Enhanced 5G-Enabled Simulator
 # ---------------------------------------------------------------------
+@njit(fastmath=True, cache=True)
+def _fiveg_latency_one(is_edge, load, size_mb, fading, interference, backbone,
+                       base_edge_ms, base_cloud_ms):
+    """FiveGDistributedSimulator.latency_ms for one task, given its pre-drawn noise."""
+    l = min(1.0, max(0.0, load))
+    # Transmission delay: Size / Bandwidth (Dynamic based on load)
+    # 5G Uplink assumption: aligned with proposal (1-20 Mbps)
+    # We use 20.0 Mbps as the peak realistic capacity; bandwidth shrinks with load.
+    bandwidth_available = 20.0 * (1.0 - (0.5 * l))
+    tx_delay = (size_mb * 8.0) / max(1.0, bandwidth_available) * 1000.0
+    if is_edge:
+        # Edge: Phy effects + Tx delay + Processing queue
+        return base_edge_ms + tx_delay + max(0.0, fading + interference) + (l * 10.0)
+    # Cloud: Backhaul + Core Network delay
+    return base_cloud_ms + backbone + tx_delay + (l * 5.0)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _fiveg_latency_kernel(is_edge, load, sizes, fading, interference, backbone,
+                          base_edge_ms, base_cloud_ms, out):
+    """Vectorised FiveGDistributedSimulator.latency_ms over pre-drawn noise."""
+    for i in prange(sizes.shape[0]):
+        out[i] = _fiveg_latency_one(is_edge[i], load[i], sizes[i], fading[i], interference[i],
+                                    backbone[i], base_edge_ms, base_cloud_ms)
+
+
 class FiveGDistributedSimulator(NetworkSimulator):
     """
     Advanced simulator modeling 5G characteristics including:
@@ -74,12 +225,20 @@ class FiveGDistributedSimulator(NetworkSimulator):
         base_cloud_ms: float = 20.0,
         interference_prob: float = 0.1,
         fading_variance: float = 2.0,
+        seed=None,
     ):
-        super().__init__(base_edge_ms/1000.0, base_cloud_ms/1000.0)
+        super().__init__(base_edge_ms/1000.0, base_cloud_ms/1000.0, seed=seed)
         self.base_edge_ms = base_edge_ms
         self.base_cloud_ms = base_cloud_ms
         self.interference_prob = interference_prob
         self.fading_var = fading_variance
+        self._std_normal_buf: list[float] = []
+
+    def _next_std_normal(self) -> float:
+        """Next N(0, 1) draw for the scalar path, served from a pre-drawn block."""
+        if not self._std_normal_buf:
+            self._std_normal_buf = self._rng.standard_normal(_NOISE_BLOCK).tolist()
+        return self._std_normal_buf.pop()
 
     def _calculate_channel_conditions(self) -> float:
         """
@@ -87,94 +246,143 @@ class FiveGDistributedSimulator(NetworkSimulator):
         Returns latency penalty in ms.
         """
         # Multipath fading (Rayleigh approximation for NLOS)
-        fading = random.gauss(0, self.fading_var)
+        fading = self._next_std_normal() * self.fading_var
         
         # Interference (SINR degradation)
         interference = 0.0
-        if random.random() < self.interference_prob:
+        if self._next_uniform() < self.interference_prob:
             # High interference causing packet retransmissions (HARQ)
-            interference = random.uniform(5.0, 15.0) 
-            
-        return max(0.0, fading + interference)
+            interference = 5.0 + 10.0 * self._next_uniform()
+        
+        # Conditional expressions rather than max()/min() on the scalar paths:
+        # no builtin lookup or call per task
+        penalty = fading + interference
+        return penalty if penalty > 0.0 else 0.0
 
-    def latency_ms(self, node_type: str, load: float, task_size_mb: float) -> float:
-        t = node_type.lower()
-        load = max(0.0, min(1.0, load))
+    def latency_ms(self, node_type: str | int, load: float, task_size_mb: float) -> float:
+        if node_type.__class__ in _BOOL_TYPES:
+            raise TypeError(_BOOL_NODE_MSG)
+        is_edge = _NODE_IS_EDGE.get(node_type)
+        if is_edge is None:
+            is_edge = _is_edge(node_type)
         
-        # Channel physical layer effects
+        # Channel physical layer effects (edge) / backhaul draw (cloud)
         phy_penalty = self._calculate_channel_conditions()
+        backbone = 0.0 if is_edge else 10.0 + 20.0 * self._next_uniform()
         
-        # Transmission delay: Size / Bandwidth (Dynamic based on load)
-        # Transmission delay: Size / Bandwidth (Dynamic based on load)
-        # 5G Uplink assumption: aligned with proposal (1-20 Mbps) 
-        # We use 20.0 Mbps as the peak realistic capacity for this scenario.
-        bandwidth_base = 20.0 
-        bandwidth_available = bandwidth_base * (1.0 - (0.5 * load)) # Bandwidth shrinks with load
-        tx_delay = (task_size_mb * 8) / max(1.0, bandwidth_available) * 1000 # to ms
-
-        if "edge" in t:
-            # Edge: Phy effects + Tx delay + Processing queue
-            return self.base_edge_ms + tx_delay + phy_penalty + (load * 10.0)
-
-        # Cloud: Backhaul + Core Network delay
-        backbone = random.uniform(10, 30)
-        return self.base_cloud_ms + backbone + tx_delay + (load * 5.0)
+        # Compiled model shared with latency_ms_batch; phy_penalty is already >= 0
+        return _fiveg_latency_one(is_edge, load, task_size_mb, phy_penalty, 0.0, backbone,
+                                  float(self.base_edge_ms), float(self.base_cloud_ms))
 
     def simulate_latency(self, node_type: str, app_type: str, task_size_mb: float = 1.0, node_load: float = 0.0) -> float:
         """
         Override parent method to use advanced latency modeling.
         Converts result from milliseconds to seconds for compatibility.
         """
-        # Calculate normalized load (0.0 to 1.0)
-        # Assuming max capacity of 100MB for normalization
-        normalized_load = min(1.0, max(0.0, node_load / 100.0))
-        
-        # Use the advanced latency_ms method
-        latency_ms = self.latency_ms(node_type, normalized_load, task_size_mb)
+        # Normalised load; latency_ms clamps it to [0, 1] itself
+        latency_ms = self.latency_ms(node_type, node_load * _LOAD_SCALE, task_size_mb)
         
         # Convert from milliseconds to seconds (as expected by Node.execute_task)
         return latency_ms / 1000.0
 
+    def draw_channel_noise(self, n: int) -> tuple:
+        """
+        Noise for n latency_ms calls: (fading, interference, backbone) arrays.
+        Edge tasks use fading + interference, cloud tasks use backbone.
+        """
+        rng = self._rng
+        fading = rng.normal(0.0, self.fading_var, n)
+        interference = np.where(rng.random(n) < self.interference_prob, rng.uniform(5.0, 15.0, n), 0.0)
+        backbone = rng.uniform(10.0, 30.0, n)
+        return fading, interference, backbone
+
+    def latency_ms_batch(self, is_edge, load, task_size_mb) -> np.ndarray:
+        """
+        Batched latency_ms: one latency per task, drawing all channel noise up front.
+        
+        Args:
+            is_edge: Boolean array, True where the task runs on an edge node;
+                NODE_EDGE/NODE_CLOUD flags or node-type names are accepted too
+            load: Normalised node load (0.0 to 1.0) seen by each task
+            task_size_mb: Task sizes in MB
+        """
+        is_edge = _edge_mask(is_edge)
+        load = np.asarray(load, dtype=np.float64)
+        sizes = np.asarray(task_size_mb, dtype=np.float64)
+        n = sizes.shape[0]
+        
+        fading, interference, backbone = self.draw_channel_noise(n)
+        
+        out = np.empty(n, dtype=np.float64)
+        _fiveg_latency_kernel(is_edge, load, sizes, fading, interference, backbone,
+                              float(self.base_edge_ms), float(self.base_cloud_ms), out)
+        return out
+
+    def simulate_latency_batch(self, is_edge, task_size_mb, node_load, app_types=None) -> np.ndarray:
+        """
+        Batched simulate_latency. Returns latencies in seconds.
+        The app type does not affect this model, so app_types is ignored.
+        """
+        # Clamped to [0, 1] per task inside the kernel
+        normalized_load = np.asarray(node_load, dtype=np.float64) * _LOAD_SCALE
+        return self.latency_ms_batch(is_edge, normalized_load, task_size_mb) / 1000.0
+
 
 # ---------------------------------------------------------------------
 # Simu5G stub adapter (optional)
 # ---------------------------------------------------------------------
+_ROUND_TRIP_S = 0.0005  # emulated Simu5G request/response time
+_DELAY_FLUSH_S = 0.01   # scalar calls sleep off accumulated round trips in chunks this size
+
+
 class Simu5GAdapter(NetworkSimulator):
     """
     A mock adapter that mimics latency feedback from an external Simu5G instance.
+    
+    simulate_delay=True also emulates the Simu5G round trip in wall-clock
+    time; it is off by default, since it changes no latency value.
     """
 
-    def __init__(self, endpoint: str | None = None, simulate_delay: bool = True):
-        import time
+    def __init__(self, endpoint: str | None = None, simulate_delay: bool = False, seed=None):
+        super().__init__(seed=seed)
         self.endpoint = endpoint or "localhost:5555"
         self.simulate_delay = simulate_delay
-        self._seeded = False
         self._time = time
+        self._owed_delay_s = 0.0  # emulated round trips not yet slept
 
-    def _seed(self):
-        if not self._seeded:
-            random.seed(self._time.time())
-            self._seeded = True
-
-    def latency_ms(self, node_type: str, load: float, task_size_mb: float) -> float:
-        self._seed()
-        t = node_type.lower()
+    def latency_ms(self, node_type: str | int, load: float, task_size_mb: float) -> float:
+        # Checked before any draw, so a rejected call leaves the seeded stream alone
+        if node_type.__class__ in _BOOL_TYPES:
+            raise TypeError(_BOOL_NODE_MSG)
         base_edge = 4.5
         base_cloud = 22.0
         load_penalty = 25.0 * load
-        noise = random.uniform(-1.5, 1.5)
+        noise = 3.0 * self._next_uniform() - 1.5
         size_effect = 0.5 * (task_size_mb ** 0.5)
 
-        if "edge" in t:
+        is_edge = _NODE_IS_EDGE.get(node_type)
+        if is_edge is None:
+            is_edge = _is_edge(node_type)
+        if is_edge:
             latency = base_edge + load_penalty + noise + size_effect
         else:
-            backbone = random.uniform(10, 30)
+            backbone = 10.0 + 20.0 * self._next_uniform()
             latency = base_cloud + backbone + load_penalty + noise + size_effect
 
         if self.simulate_delay:
-            self._time.sleep(0.0005)
+            # Pay the emulated round trips in sleeps of at least _DELAY_FLUSH_S,
+            # not one scheduler wake-up per call; flush_delay pays the rest
+            self._owed_delay_s += _ROUND_TRIP_S
+            if self._owed_delay_s >= _DELAY_FLUSH_S:
+                self.flush_delay()
+
+        return latency if latency > 1.0 else 1.0
 
-        return max(1.0, latency)
+    def flush_delay(self) -> None:
+        """Sleep off the emulated round trips that scalar calls still owe."""
+        if self._owed_delay_s > 0.0:
+            self._time.sleep(self._owed_delay_s)
+            self._owed_delay_s = 0.0
 
     def simulate_latency(self, node_type: str, app_type: str, task_size_mb: float = 1.0, node_load: float = 0.0) -> float:
         """
@@ -182,7 +390,8 @@ class Simu5GAdapter(NetworkSimulator):
         Converts result from milliseconds to seconds for compatibility.
         """
         # Calculate normalized load (0.0 to 1.0)
-        normalized_load = min(1.0, max(0.0, node_load / 100.0))
+        normalized_load = node_load * _LOAD_SCALE
+        normalized_load = 0.0 if normalized_load < 0.0 else (1.0 if normalized_load > 1.0 else normalized_load)
         
         # Use the advanced latency_ms method
         latency_ms = self.latency_ms(node_type, normalized_load, task_size_mb)
@@ -190,6 +399,36 @@ class Simu5GAdapter(NetworkSimulator):
         # Convert from milliseconds to seconds (as expected by Node.execute_task)
         return latency_ms / 1000.0
 
+    def latency_ms_batch(self, is_edge, load, task_size_mb) -> np.ndarray:
+        """
+        Batched latency_ms. The emulated Simu5G round trip is paid once per
+        batch instead of once per task.
+        """
+        rng = self._rng
+        is_edge = _edge_mask(is_edge)
+        load = np.asarray(load, dtype=np.float64)
+        sizes = np.asarray(task_size_mb, dtype=np.float64)
+        n = sizes.shape[0]
+
+        noise = rng.uniform(-1.5, 1.5, n)
+        backbone = rng.uniform(10.0, 30.0, n)
+        latency = 25.0 * load + noise + 0.5 * np.sqrt(sizes)
+        latency += np.where(is_edge, 4.5, 22.0 + backbone)
+
+        if self.simulate_delay:
+            # One round trip for the whole batch, plus any still owed
+            self._owed_delay_s += _ROUND_TRIP_S
+            self.flush_delay()
+
+        return np.maximum(1.0, latency)
+
+    def simulate_latency_batch(self, is_edge, task_size_mb, node_load, app_types=None) -> np.ndarray:
+        """
+        Batched simulate_latency. Returns latencies in seconds.
+        """
+        normalized_load = np.clip(np.asarray(node_load, dtype=np.float64) * _LOAD_SCALE, 0.0, 1.0)
+        return self.latency_ms_batch(is_edge, normalized_load, task_size_mb) / 1000.0
+
     def __repr__(self):
         return f"<Simu5GAdapter endpoint={self.endpoint}>"
 
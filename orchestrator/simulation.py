@@ -1,26 +1,41 @@
 # orchestrator/simulation.py
-import random
+import functools
+
 import numpy as np
 
+
+@functools.lru_cache(maxsize=32)
+def _is_edge_name(node_type: str) -> bool:
+    """True if node_type names the edge node (any case), resolved once per name."""
+    return node_type.lower() == "edge"
+
+
 class NetworkSimulator:
     """
     Simulates varying 5G network latency and congestion for Edge and Cloud.
     """
 
-    def __init__(self):
+    def __init__(self, seed=None):
         # Typical 5G edge & cloud base latencies (ms)
         self.edge_base = 5
         self.cloud_base = 25
+        self._rng = np.random.default_rng(seed)
+        self._noise_buf = []     # N(0, 2) draws, refilled in blocks
+        self._backbone_buf = []  # U(10, 30) draws, refilled in blocks
 
     def get_latency(self, node_type, load_factor):
         """
         Returns a simulated latency (ms) for the requested node type.
         load_factor ∈ [0,1]  -> more load = higher latency.
         """
-        noise = np.random.normal(0, 2)       # small random fluctuation
+        if not self._noise_buf:
+            self._noise_buf = self._rng.normal(0, 2, 4096).tolist()
+        noise = self._noise_buf.pop()        # small random fluctuation
         congestion = load_factor * 20        # each 0.1 load adds ~2 ms
-        if node_type.lower() == "edge":
+        if _is_edge_name(node_type):
             return max(1, self.edge_base + congestion + noise)
         else:
-            backbone = random.uniform(10, 30)  # internet/core latency
+            if not self._backbone_buf:
+                self._backbone_buf = self._rng.uniform(10, 30, 4096).tolist()
+            backbone = self._backbone_buf.pop()  # internet/core latency
             return max(1, self.cloud_base + congestion + backbone + noise)
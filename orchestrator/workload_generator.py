@@ -4,13 +4,10 @@ Enhanced synthetic workload generator for 5G-era tasks.
 Consolidated version with Poisson inter-arrival times and flexible configuration.
 """
 from __future__ import annotations
-import csv
-import random
-import math
 import os
-import sys
-from datetime import datetime, timedelta
-from pathlib import Path
+from datetime import datetime
+
+import numpy as np
 
 # Import safe print utility
 try:
@@ -27,6 +24,9 @@ except ImportError:
                 print(msg.encode('ascii', 'replace').decode('ascii'))
 
 
+_WRITE_CHUNK = 65536  # rows formatted per write in generate()
+
+
 class WorkloadGenerator:
     """
     Enhanced synthetic workload generator for 5G-era tasks.
@@ -66,8 +66,9 @@ class WorkloadGenerator:
         self.include_timestamps = include_timestamps and (poisson_lambda is not None)
         self.output_file = os.path.join(out_dir, "workloads.csv")
 
-        if random_seed is not None:
-            random.seed(random_seed)
+        # Private RNG, so seeding never touches the process-wide random state;
+        # generate() samples whole columns from it
+        self._rng = np.random.default_rng(random_seed)
 
         # Define app profiles (size ranges in MB)
         self.app_profiles = {
@@ -84,30 +85,55 @@ class WorkloadGenerator:
                 "priority_weights": {"low": 0.3, "medium": 0.5, "high": 0.2}
             },
         }
+        
+        # Per-app lookups used by _sample_columns
+        self._app_names = tuple(self.app_profiles)
+        self._size_ranges = {k: v["size_range"] for k, v in self.app_profiles.items()}
+        self._prio_keys = {k: tuple(v["priority_weights"]) for k, v in self.app_profiles.items()}
+        self._prio_weights = {k: tuple(v["priority_weights"].values()) for k, v in self.app_profiles.items()}
 
-    def _next_arrival_delta(self) -> float:
-        """Generate next inter-arrival interval (seconds) using exponential distribution."""
-        if self.poisson_lambda is None:
-            return 0.0
-        return random.expovariate(self.poisson_lambda)
-
-    def _choose_priority(self, app_type: str) -> str:
-        """Choose priority based on app type weights."""
-        weights = self.app_profiles[app_type]["priority_weights"]
-        return random.choices(list(weights.keys()), list(weights.values()))[0]
-
-    def _generate_task(self, task_id: int, current_time: datetime | None = None) -> tuple:
-        """Create one realistic task event."""
-        app_type = random.choice(list(self.app_profiles.keys()))
-        size_range = self.app_profiles[app_type]["size_range"]
-        size = random.uniform(*size_range)
-        priority = self._choose_priority(app_type)
+    def _sample_columns(self) -> tuple:
+        """
+        Sample every task at once: (app_types, sizes, priorities, timestamps).
         
-        if self.include_timestamps and current_time is not None:
-            timestamp = current_time.strftime("%Y-%m-%d %H:%M:%S")
-            return (task_id, timestamp, app_type, round(size, 3), priority)
-        else:
-            return (task_id, app_type, round(size, 3), priority)
+        timestamps is None when timestamps are disabled.
+        """
+        rng = self._rng
+        n = self.num_tasks
+        app_names = self._app_names
+        app_idx = rng.integers(0, len(app_names), n)
+        
+        # Per-app size bounds, indexed by app
+        lo = np.array([self._size_ranges[a][0] for a in app_names])
+        hi = np.array([self._size_ranges[a][1] for a in app_names])
+        sizes = np.round(lo[app_idx] + rng.random(n) * (hi - lo)[app_idx], 3)
+        
+        # Per-app cumulative priority weights over a shared list of priority names
+        prio_names = list(dict.fromkeys(k for a in app_names for k in self._prio_keys[a]))
+        weights = np.array([
+            [dict(zip(self._prio_keys[a], self._prio_weights[a])).get(k, 0.0) for k in prio_names]
+            for a in app_names
+        ])
+        cum = np.cumsum(weights, axis=1)
+        cum /= cum[:, -1:]
+        u = rng.random(n)
+        prio_idx = np.minimum((u[:, None] >= cum[app_idx]).sum(axis=1), len(prio_names) - 1)
+        
+        timestamps = None
+        if self.include_timestamps:
+            offsets = np.cumsum(rng.exponential(1.0 / self.poisson_lambda, n))
+            # datetime64 has no time zones: drop tzinfo so an aware base_time
+            # keeps its own wall-clock time, as strftime on it would
+            base = np.datetime64(self.base_time.replace(tzinfo=None), "us")
+            times = base + (offsets * 1e6).astype("timedelta64[us]")
+            timestamps = np.char.replace(np.datetime_as_string(times, unit="s"), "T", " ")
+        
+        return (
+            np.array(app_names)[app_idx],
+            sizes,
+            np.array(prio_names)[prio_idx],
+            timestamps,
+        )
 
     def generate(self) -> str:
         """
@@ -117,33 +143,41 @@ class WorkloadGenerator:
             Path to generated file
         """
         os.makedirs(self.out_dir, exist_ok=True)
-        current_time = self.base_time
-        tasks = []
+        app_types, sizes, priorities, timestamps = self._sample_columns()
+        n = self.num_tasks
+        if self.include_timestamps:
+            header = "task_id,timestamp,app_type,size_mb,priority\n"
+        else:
+            header = "task_id,app_type,size_mb,priority\n"
 
-        with open(self.output_file, "w", newline="") as f:
-            writer = csv.writer(f)
-            
-            # Write header based on whether timestamps are included
-            if self.include_timestamps:
-                writer.writerow(["task_id", "timestamp", "app_type", "size_mb", "priority"])
-            else:
-                writer.writerow(["task_id", "app_type", "size_mb", "priority"])
-            
-            for i in range(self.num_tasks):
+        # Rows are formatted and written _WRITE_CHUNK at a time, so the text
+        # of the whole file is never held in memory at once; the columns
+        # never need CSV quoting.
+        with open(self.output_file, "w", newline="", buffering=1 << 20) as f:
+            f.write(header)
+            for start in range(0, n, _WRITE_CHUNK):
+                stop = min(start + _WRITE_CHUNK, n)
+                ids = range(start, stop)
+                apps = app_types[start:stop].tolist()
+                size_list = sizes[start:stop].tolist()
+                prios = priorities[start:stop].tolist()
                 if self.include_timestamps:
-                    delta = self._next_arrival_delta()
-                    current_time += timedelta(seconds=delta)
-                    task = self._generate_task(i, current_time)
+                    times = timestamps[start:stop].tolist()
+                    rows = [f"{i},{t},{a},{s:.3f},{p}\n" for i, t, a, s, p in zip(ids, times, apps, size_list, prios)]
                 else:
-                    task = self._generate_task(i)
-                
-                writer.writerow(task)
-                tasks.append(task)
+                    rows = [f"{i},{a},{s:.3f},{p}\n" for i, a, s, p in zip(ids, apps, size_list, prios)]
+                f.write("".join(rows))
+
+        first = None
+        if n:
+            first = (0, str(app_types[0]), float(sizes[0]), str(priorities[0]))
+            if self.include_timestamps:
+                first = first[:1] + (str(timestamps[0]),) + first[1:]
 
         safe_print(
-            f"[OK] Generated {len(tasks)} tasks -> {self.output_file}",
-            fallback=f"[OK] Generated {len(tasks)} tasks -> {self.output_file}"
+            f"[OK] Generated {n} tasks -> {self.output_file}",
+            fallback=f"[OK] Generated {n} tasks -> {self.output_file}"
         )
-        if tasks:
-            print(f"Example: {tasks[0]}")
+        if first is not None:
+            print(f"Example: {first}")
         return self.output_file
@@ -2,30 +2,77 @@
 """
 Example usage:
     python runner/exp_cli.py --episodes 100 200 300 --tasks 150 --sim simple
+    python runner/exp_cli.py --episodes 100 200 300 --jobs 3
+
+Trials run one at a time by default, all writing to DATA_DIR (default
+"data"). With --jobs above 1 they run concurrently and each trial writes
+its artifacts to its own <DATA_DIR>/<run_id> directory instead.
 """
 
-import argparse, os, subprocess
+import argparse, os, subprocess, uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 
+
+def run_trial(env, capture):
+    """Run one main_remote.py trial; returns the finished CompletedProcess."""
+    return subprocess.run(
+        ["python", "main_remote.py"],
+        env=env,
+        check=False,
+        capture_output=capture,
+        text=True,
+    )
+
+
 def main():
     p = argparse.ArgumentParser()
     p.add_argument("--episodes", nargs="+", type=int, default=[200, 300])
     p.add_argument("--tasks", type=int, default=300)
     p.add_argument("--sim", type=str, default="simple")
+    p.add_argument("--jobs", type=int, default=1,
+                   help="trials to run at once (default: 1); above 1, each trial "
+                        "writes to its own <DATA_DIR>/<run_id> directory")
     args = p.parse_args()
+    jobs = max(1, args.jobs)
 
+    # Copy the environment once; trials only add their own few keys on top
+    base_env = os.environ.copy()
+    base_env["SIM_TYPE"] = args.sim
+    data_dir = base_env.get("DATA_DIR", "data")
+
+    # Run IDs are fixed up front; the random suffix keeps trials started in
+    # the same second (or by another exp_cli) from sharing an S3 prefix
+    trials = []
     for ep in args.episodes:
-        run_id = f"run-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}"
-        env = os.environ.copy()
-        env["RUN_ID"] = run_id
-        env["SIM_TYPE"] = args.sim
-        print(f"\n[START] Starting trial {run_id} | episodes={ep}, tasks={args.tasks}, sim={args.sim}")
-        subprocess.run(
-            ["python", "main_remote.py"],
-            env=env,
-            check=False
-        )
-        print(f"[OK] Trial complete -> {run_id}\n{'-'*60}")
+        run_id = f"run-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}-{uuid.uuid4().hex[:8]}"
+        env = {**base_env, "RUN_ID": run_id, "EPISODES": str(ep)}
+        if jobs > 1:
+            # Concurrent trials each write their artifacts to their own directory
+            env["DATA_DIR"] = os.path.join(data_dir, run_id)
+        trials.append((run_id, ep, env))
+
+    if jobs == 1:
+        for run_id, ep, env in trials:
+            print(f"\n[START] Starting trial {run_id} | episodes={ep}, tasks={args.tasks}, sim={args.sim}")
+            run_trial(env, capture=False)
+            print(f"[OK] Trial complete -> {run_id}\n{'-'*60}")
+        return
+
+    # Trials are separate processes, so threads are enough to drive them;
+    # each trial's output is printed in one piece when it finishes.
+    print(f"[START] Starting {len(trials)} trials, {jobs} at a time | tasks={args.tasks}, sim={args.sim}")
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(run_trial, env, True): (run_id, ep) for run_id, ep, env in trials}
+        for future in as_completed(futures):
+            run_id, ep = futures[future]
+            result = future.result()
+            print(f"\n[INFO] Trial {run_id} | episodes={ep}")
+            print(result.stdout, end="")
+            if result.stderr:
+                print(result.stderr, end="")
+            status = "[OK] Trial complete" if result.returncode == 0 else f"[WARN] Trial exited with {result.returncode}"
+            print(f"{status} -> {run_id}\n{'-'*60}")
 
 if __name__ == "__main__":
     main()
@@ -9,3 +9,68 @@ def test_aggregate_latency_basic():
     agg = aggregate_latency(df)
     assert "mean" in agg.columns
     assert abs(agg.loc[agg.strategy=="RL","mean"].values[0]-105) < 1e-6
+
+def test_aggregate_latency_matches_groupby():
+    df = pd.DataFrame({
+        "strategy": pd.Categorical(["RL","Rule","RL","Rule","Random"], categories=["RL","Random","Rule","Unused"]),
+        "latency": [100.0,200.0,130.0,260.0,50.0]
+    })
+    agg = aggregate_latency(df).set_index("strategy")
+    expected = df.groupby("strategy", observed=True)["latency"].agg(["mean","std","count"])
+    assert list(agg.index) == ["RL","Random","Rule"]
+    assert (agg["count"] == expected["count"]).all()
+    assert abs(agg.loc["Rule","std"] - expected.loc["Rule","std"]) < 1e-9
+    assert agg.loc["Random","std"] == 0.0
+
+def test_normalize_dataframe_is_idempotent():
+    from analysis.report_utils import normalize_dataframe
+    raw = pd.DataFrame({"task_id": [1, 2], "node": ["edge_0", "cloud_1"], "latency_ms": [10.0, 20.0]})
+    df = normalize_dataframe(raw)
+    assert list(raw.columns) == ["task_id", "node", "latency_ms"]
+    assert list(df["strategy"]) == ["RL-Edge", "RL-Cloud"]
+    assert normalize_dataframe(df) is df
+
+class FakeS3:
+    """Serves workload_results.csv bodies for download_all_runs."""
+    def __init__(self, files):
+        self.files = files
+
+    def get_paginator(self, name):
+        files = self.files
+        class Paginator:
+            def paginate(self, **kwargs):
+                return [{"Contents": [{"Key": k, "ETag": k, "Size": len(v)} for k, v in files.items()]}]
+        return Paginator()
+
+    def get_object(self, Bucket, Key):
+        import io
+        return {"Body": io.BytesIO(self.files[Key].encode())}
+
+def _download_mixed_runs(monkeypatch, tmp_path, use_pyarrow):
+    import boto3
+    import analysis.analyze_results as ar
+    files = {
+        "runs/run-a/workload_results.csv": "strategy,app_type,size_mb,priority,node,latency\nRule,IoT,1.0,low,edge_0,100.0\n",
+        "runs/run-b/workload_results.csv": "task_id,node,latency_ms\n1,cloud_1,300.0\n2,edge_0,50.0\n",
+    }
+    monkeypatch.setattr(boto3, "client", lambda *args, **kwargs: FakeS3(files))
+    monkeypatch.setattr(ar, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(ar, "COMBINED_PATH", str(tmp_path / "combined.parquet"))
+    if not use_pyarrow:
+        monkeypatch.setattr(ar, "pa", None)
+    return ar.download_all_runs()
+
+def test_download_combines_both_result_formats(monkeypatch, tmp_path):
+    for use_pyarrow in (True, False):
+        df = _download_mixed_runs(monkeypatch, tmp_path / str(use_pyarrow), use_pyarrow)
+        assert list(df["run_id"]) == ["run-a", "run-b", "run-b"]
+        assert list(df["strategy"]) == ["Rule", "RL-Cloud", "RL-Edge"]
+        assert list(df["latency"]) == [100.0, 300.0, 50.0]
+
+def test_results_table_csv_round_trips(tmp_path):
+    import analysis.analyze_results as ar
+    df = pd.DataFrame({"strategy": ["RL", "Rule, v2"], "latency": [1.5, 2.0]})
+    path = tmp_path / "results.csv"
+    ar.write_results_table(df, str(path))
+    pd.testing.assert_frame_equal(pd.read_csv(path), df)
+    assert path.read_text().splitlines()[1] == '"RL",1.5'  # numbers are not quoted
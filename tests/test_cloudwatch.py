@@ -0,0 +1,55 @@
+import utils.cloudwatch as cloudwatch
+
+
+class FakeCloudWatch:
+    def __init__(self):
+        self.batches = []
+
+    def put_metric_data(self, Namespace, MetricData):
+        self.batches.append(list(MetricData))
+
+
+def test_metrics_are_sent_in_batches(monkeypatch):
+    fake = FakeCloudWatch()
+    monkeypatch.setattr(cloudwatch, "has_credentials", lambda: True)
+    monkeypatch.setattr(cloudwatch, "get_client", lambda *args, **kwargs: fake)
+    metrics = cloudwatch.CloudWatchMetrics()
+
+    for i in range(45):
+        metrics.put_metric("TaskLatency", float(i), "Milliseconds")
+    metrics.flush()
+
+    assert [len(b) for b in fake.batches] == [20, 20, 5]
+    assert [m["Value"] for b in fake.batches for m in b] == [float(i) for i in range(45)]
+
+
+class FakeLogs:
+    def __init__(self):
+        self.calls = []
+
+    def create_log_group(self, **kwargs):
+        pass
+
+    def put_retention_policy(self, **kwargs):
+        pass
+
+    def create_log_stream(self, **kwargs):
+        pass
+
+    def put_log_events(self, **params):
+        self.calls.append(params)
+        return {"nextSequenceToken": str(len(self.calls))}
+
+
+def test_log_events_are_sent_in_batches(monkeypatch):
+    fake = FakeLogs()
+    monkeypatch.setattr(cloudwatch, "has_credentials", lambda: True)
+    monkeypatch.setattr(cloudwatch, "get_client", lambda *args, **kwargs: fake)
+    logger = cloudwatch.CloudWatchLogger(log_stream="test")
+
+    for i in range(5):
+        logger.info(f"message {i}")
+    assert cloudwatch.flush_and_join()
+
+    assert [e["message"] for call in fake.calls for e in call["logEvents"]] == [f"[INFO] message {i}" for i in range(5)]
+    assert len(fake.calls) < 5
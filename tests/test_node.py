@@ -2,7 +2,8 @@
 Tests for Node class and task execution.
 """
 import pytest
-from orchestrator.environment import Node, Task
+import numpy as np
+from orchestrator.environment import Node, Task, execute_placements
 from orchestrator.sim_interface import NetworkSimulator, FiveGDistributedSimulator, Simu5GAdapter
 
 
@@ -24,7 +25,12 @@ class TestNode:
         cloud = Node(1, "cloud", 8.0)
         assert edge.name == "edge_0"
         assert cloud.name == "cloud_1"
-    
+
+    def test_task_labels_are_lowercased(self):
+        """Task stores app type and priority lower-cased."""
+        task = Task(1, "IoT", 2.0, "HIGH")
+        assert (task.app_type, task.priority) == ("iot", "high")
+
     def test_execute_task_without_simulator(self):
         """Test task execution without network simulator."""
         node = Node(0, "edge", 2.0)
@@ -141,3 +147,68 @@ class TestNode:
         # Verify load was updated
         assert node.current_load == 25.0
 
+
+
+class TestExecutePlacements:
+    """Test batched task execution."""
+    
+    def test_matches_sequential_execution(self):
+        """Without a simulator the batch equals per-task execute_task calls."""
+        sizes = np.array([1.0, 6.0, 2.5, 9.0, 0.5])
+        to_edge = np.array([True, False, True, False, True])
+        apps = ["IoT", "ARVR", "VANET", "IoT", "ARVR"]
+        
+        edge, cloud = Node(0, "edge", 2.0), Node(1, "cloud", 8.0)
+        expected = [
+            (edge if e else cloud).execute_task(Task(i, apps[i], float(sizes[i]), "low"))
+            for i, e in enumerate(to_edge)
+        ]
+        
+        b_edge, b_cloud = Node(0, "edge", 2.0), Node(1, "cloud", 8.0)
+        latency, energy = execute_placements(b_edge, b_cloud, sizes, to_edge, apps)
+        
+        assert np.allclose(latency, [lat for lat, _ in expected])
+        assert np.allclose(energy, [en for _, en in expected])
+        assert b_edge.current_load == edge.current_load == 4.0
+        assert b_cloud.current_load == cloud.current_load == 15.0
+    
+    def test_batch_with_simulator(self):
+        """Batched simulator latency is added on top of processing time."""
+        edge, cloud = Node(0, "edge", 2.0), Node(1, "cloud", 8.0)
+        sizes = np.full(50, 2.0)
+        to_edge = np.arange(50) % 2 == 0
+        latency, energy = execute_placements(edge, cloud, sizes, to_edge, ["IoT"] * 50,
+                                             network_sim=FiveGDistributedSimulator())
+        assert latency.shape == (50,)
+        assert (latency[to_edge] > 1000).all()  # 2 MB / 2 Mbps on edge
+        assert (energy > 0).all()
+
+
+class TestSimulatorDispatch:
+    """Test that Node adapts to simulators with different call signatures."""
+    
+    def test_basic_signature_simulator(self):
+        """Simulators taking only (node_type, app_type) are still supported."""
+        class BasicSim:
+            def simulate_latency(self, node_type, app_type):
+                return 0.5
+        
+        node = Node(0, "edge", 2.0)
+        latency, _ = node.execute_task(Task(1, "IoT", 2.0, "high"), network_sim=BasicSim())
+        assert latency == pytest.approx(1500.0)
+    
+    def test_simulator_without_simulate_latency(self):
+        """Objects without simulate_latency add the 1 ms fallback."""
+        node = Node(0, "edge", 2.0)
+        latency, _ = node.execute_task(Task(1, "IoT", 2.0, "high"), network_sim=object())
+        assert latency == pytest.approx(1001.0)
+    
+    def test_simulator_errors_propagate(self):
+        """Errors raised inside a simulator are no longer replaced by the fallback."""
+        class BrokenSim:
+            def simulate_latency(self, node_type, app_type, task_size_mb=1.0, node_load=0.0):
+                raise RuntimeError("sim failure")
+        
+        node = Node(0, "edge", 2.0)
+        with pytest.raises(RuntimeError):
+            node.execute_task(Task(1, "IoT", 2.0, "high"), network_sim=BrokenSim())
@@ -96,7 +96,16 @@ class TestRLOrchestrator:
         assert node_name == "cloud_1"
         assert latency > 0
         assert energy > 0
-    
+
+    def test_assign_and_execute_raw(self):
+        """Encoded-field execution matches assign_and_execute without a simulator."""
+        orch = RLBasedOrchestrator()
+        orch.set_simulator(None)
+        expected = orch.assign_and_execute(Task(1, "ARVR", 6.0, "medium"), action=1)
+        orch.cloud.reset_load()
+        assert orch.assign_and_execute_raw(1, 1, 6.0, action=1) == expected
+        assert orch.cloud.current_load == 6.0
+
     def test_choose_action_epsilon_greedy(self):
         """Test epsilon-greedy action selection."""
         orch = RLBasedOrchestrator(epsilon=0.0)  # No exploration
@@ -165,7 +174,15 @@ class TestRLOrchestrator:
         finally:
             if os.path.exists(temp_path):
                 os.remove(temp_path)
-    
+
+    def test_load_weights_rejects_wrong_shape(self, tmp_path):
+        """Weights saved for a different feature set are not loaded."""
+        path = tmp_path / "weights.npy"
+        np.save(path, np.ones(4))
+        orch = RLBasedOrchestrator()
+        assert not orch.load_weights(str(path))
+        assert orch.weights.shape == (6,)
+
     def test_simulate_environment_resets_loads(self):
         """Test that simulate_environment resets node loads each episode."""
         orch = RLBasedOrchestrator(episodes=2)
@@ -181,3 +198,163 @@ class TestRLOrchestrator:
         # avg_latency can be 0 if all rewards are 0, so just check it's a number
         assert isinstance(avg_latency, (int, float))
 
+
+
+class TestStateFreeGreedyAction:
+    """Test the single greedy action used to batch RL evaluation."""
+    
+    def test_matches_greedy_action_in_every_state(self):
+        """The state-free action agrees with choose_action_greedy for any state."""
+        rng = np.random.default_rng(0)
+        for w1 in (-1.0, 2.0):
+            orch = RLBasedOrchestrator()
+            orch.weights = rng.normal(size=6)
+            orch.weights[1] = w1
+            action = orch.state_free_greedy_action()
+            assert action == (1 if w1 > 0 else 0)
+            for _ in range(20):
+                state = (int(rng.integers(3)), int(rng.integers(3)), float(rng.uniform(0, 12)), float(rng.uniform(0, 1)))
+                assert action == orch.choose_action_greedy(state)
+
+    def test_none_for_feature_extractor_subclass(self):
+        """A subclass may make the action interact with state, so it gets no single action."""
+        from orchestrator.rl_orchestrator import FeatureExtractor
+        class SizeAwareExtractor(FeatureExtractor):
+            def get_features(self, state, action, cloud_idx=1):
+                f = super().get_features(state, action, cloud_idx)
+                return f[:4] + (f[1] * f[2],) + f[5:]
+        orch = RLBasedOrchestrator()
+        orch.feature_extractor = SizeAwareExtractor()
+        assert orch.state_free_greedy_action() is None
+
+
+class TestCompiledAQLStep:
+    """Test the compiled AQL step against the FeatureExtractor path."""
+    
+    def test_update_matches_update_q(self):
+        """_aql_update and _aql_greedy reproduce update_q and choose_action_greedy."""
+        from orchestrator.rl_orchestrator import _aql_update, _aql_greedy
+        rng = np.random.default_rng(1)
+        orch = RLBasedOrchestrator()
+        orch.weights = rng.normal(size=6)
+        weights = orch.weights.copy()
+        for _ in range(50):
+            state = (0, int(rng.integers(3)), float(rng.uniform(0, 12)), float(rng.random()))
+            nxt = (0, int(rng.integers(3)), float(rng.uniform(0, 12)), float(rng.random()))
+            action, reward = int(rng.integers(2)), float(rng.normal())
+            assert _aql_greedy(weights) == orch.choose_action_greedy(state)
+            orch.update_q(state, action, reward, nxt)
+            _aql_update(weights, state[1], state[2], state[3], action, reward,
+                        nxt[1], nxt[2], nxt[3], orch.alpha, orch.gamma)
+        np.testing.assert_allclose(weights, orch.weights, rtol=1e-9, atol=1e-12)
+
+
+class TestEpsilonSchedule:
+    """Test the cosh-based exploration schedule."""
+    
+    def test_cosh_epsilon_shape(self):
+        """Epsilon starts near eps0, never increases, and decays past the horizon."""
+        from orchestrator.rl_orchestrator import cosh_epsilon
+        values = [cosh_epsilon(k, 0.3, 100) for k in range(1, 101)]
+        assert 0.28 < values[0] <= 0.3
+        assert all(b <= a for a, b in zip(values, values[1:]))
+        assert cosh_epsilon(110, 0.3, 100, eps_at_horizon=0.1) == pytest.approx(0.01)
+    
+    def test_training_keeps_epsilon_floor(self):
+        """simulate_environment never drops epsilon below min_epsilon while it decays alpha."""
+        seen = []
+        class Recording(RLBasedOrchestrator):
+            def assign_and_execute_raw(self, *args):
+                seen.append((self.epsilon, self.alpha))
+                return super().assign_and_execute_raw(*args)
+        orch = Recording(episodes=5, epsilon=0.3, epsilon_horizon=2, seed=0)
+        orch.set_simulator(None)
+        orch.simulate_environment(num_tasks=5)
+        assert min(eps for eps, _ in seen) >= orch.min_epsilon
+        assert seen[-1][1] < 0.01
+    
+    def test_training_restores_schedule_start(self):
+        """Each simulate_environment call starts from the constructor's epsilon and alpha."""
+        orch = RLBasedOrchestrator(episodes=5, epsilon=0.3, alpha=0.01, seed=0)
+        orch.set_simulator(None)
+        orch.simulate_environment(num_tasks=5)
+        assert (orch.epsilon, orch.alpha) == (0.3, 0.01)
+
+
+class TestExperienceReplay:
+    """Test the AQL replay buffer."""
+    
+    def test_ring_buffer_wraps(self):
+        """The buffer overwrites its oldest transition once full."""
+        from orchestrator.rl_orchestrator import _ReplayBuffer
+        buf = _ReplayBuffer(3)
+        for i in range(5):
+            buf.add((0, 1, float(i), 0.5), i % 2, -float(i), (0, 2, float(i + 1), 0.5))
+        assert buf.size == 3
+        assert sorted(buf.size_mb.tolist()) == [2.0, 3.0, 4.0]
+        assert sorted(buf.reward.tolist()) == [-4.0, -3.0, -2.0]
+
+    def test_replay_default_does_not_depend_on_numba(self, monkeypatch, capsys):
+        """Replay is on by default with or without numba; without it training warns."""
+        from orchestrator import jit
+        for available in (True, False):
+            monkeypatch.setattr(jit, "NUMBA_AVAILABLE", available)
+            orch = RLBasedOrchestrator(episodes=1, seed=0)
+            assert orch.replay_batch == 32
+            orch.simulate_environment(num_tasks=5)
+            assert ("numba not installed" in capsys.readouterr().out) is not available
+
+
+class TestCompiledEpisode:
+    """Test the compiled FiveG training episode against the per-step loop."""
+    
+    def test_episode_kernel_matches_step_loop(self):
+        """Same tasks and channel noise give the same steps and weights either way."""
+        from orchestrator.rl_orchestrator import _aql_reward
+        from orchestrator.sim_interface import _fiveg_latency_one
+        num_tasks = 40
+        
+        class ReplayedNoiseSim(FiveGDistributedSimulator):
+            """Per-task latency_ms fed from draw_channel_noise, in call order."""
+            calls = 0
+            
+            def latency_ms(self, node_type, load, task_size_mb):
+                if self.calls % num_tasks == 0:
+                    self._noise = self.draw_channel_noise(num_tasks)
+                f, i, b = (arr[self.calls % num_tasks] for arr in self._noise)
+                self.calls += 1
+                return _fiveg_latency_one(node_type == "edge", load, task_size_mb, f, i, b,
+                                          self.base_edge_ms, self.base_cloud_ms)
+        
+        class Recording(RLBasedOrchestrator):
+            """Records every step's (latency, energy, reward) on either path."""
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.steps = []
+            
+            def _run_fiveg_episode(self, *args):
+                latency, energy, reward = super()._run_fiveg_episode(*args)
+                self.steps.extend(zip(latency, energy, reward))
+                return latency, energy, reward
+            
+            def assign_and_execute_raw(self, app_idx, prio_idx, size_mb, action):
+                name, latency, energy = super().assign_and_execute_raw(app_idx, prio_idx, size_mb, action)
+                self.steps.append((latency, energy, _aql_reward(latency, energy, self.w_latency, self.w_energy)))
+                return name, latency, energy
+        
+        results = []
+        for sim in (FiveGDistributedSimulator(), ReplayedNoiseSim()):
+            sim._rng = np.random.default_rng(5)
+            orch = Recording(sim=sim, episodes=3, seed=11, replay_batch=0)
+            avg_latency, rewards = orch.simulate_environment(num_tasks=num_tasks)
+            results.append((orch.weights.copy(), avg_latency, rewards, orch.edge.current_load, np.array(orch.steps)))
+        
+        (w_a, lat_a, r_a, load_a, steps_a), (w_b, lat_b, r_b, load_b, steps_b) = results
+        assert steps_a.shape == (3 * num_tasks, 3)
+        # Per-step latency, energy and reward agree, not just their effect on the weights
+        np.testing.assert_allclose(steps_a, steps_b, rtol=1e-9)
+        np.testing.assert_allclose(r_b, steps_b[:, 2].reshape(3, -1).sum(axis=1), rtol=1e-9)
+        np.testing.assert_allclose(w_a, w_b, rtol=1e-9)
+        np.testing.assert_allclose(r_a, r_b, rtol=1e-9)
+        assert lat_a == pytest.approx(lat_b)
+        assert load_a == pytest.approx(load_b)
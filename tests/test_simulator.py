@@ -3,7 +3,7 @@ Tests for network simulator implementations.
 """
 import pytest
 import numpy as np
-from orchestrator.sim_interface import NetworkSimulator, FiveGDistributedSimulator, Simu5GAdapter, get_simulator
+from orchestrator.sim_interface import NetworkSimulator, FiveGDistributedSimulator, Simu5GAdapter, get_simulator, NODE_EDGE, NODE_CLOUD
 from orchestrator.environment import Task, Node
 
 
@@ -30,6 +30,13 @@ class TestNetworkSimulator:
         cloud_lat = sim.simulate_latency("cloud", "IoT")
         assert edge_lat < cloud_lat
 
+    def test_scalar_app_jitter_ranges(self):
+        """Scalar jitter stays in each app's range, whatever the name's case."""
+        sim = NetworkSimulator()
+        for app, (lo, hi) in {"iot": (0.0001, 0.0005), "ARVR": (0.001, 0.002), "other": (0.0001, 0.001)}.items():
+            jitter = sim.simulate_latency("edge", app) - sim.base_edge_latency
+            assert lo <= jitter <= hi
+
 
 class TestFiveGDistributedSimulator:
     """Test FiveGDistributedSimulator implementation."""
@@ -55,7 +62,37 @@ class TestFiveGDistributedSimulator:
         latency = sim.latency_ms("edge", load=0.0, task_size_mb=1.0)
         assert latency > 0
         assert isinstance(latency, float)
-    
+
+    def test_latency_ms_accepts_node_flags(self):
+        """Integer node flags select the same path as node-type names."""
+        sim = FiveGDistributedSimulator(fading_variance=0.0, interference_prob=0.0)
+        assert sim.latency_ms(NODE_EDGE, 0.0, 1.0) == sim.latency_ms("Edge", 0.0, 1.0)
+        assert sim.latency_ms(NODE_CLOUD, 0.0, 1.0) > sim.latency_ms(NODE_EDGE, 0.0, 1.0)
+
+    def test_bool_flag_is_not_a_node_code(self):
+        """The batch APIs read True as edge; the scalar APIs refuse bools instead of reading True as NODE_CLOUD."""
+        for sim in (FiveGDistributedSimulator(), Simu5GAdapter(simulate_delay=False), NetworkSimulator()):
+            lat = sim.simulate_latency_batch(np.array([True, False]), np.ones(2), np.zeros(2))
+            assert lat[0] < lat[1]
+            for flag in (True, np.True_):
+                with pytest.raises(TypeError):
+                    sim.simulate_latency(flag, "IoT", task_size_mb=1.0, node_load=0.0)
+
+    def test_rejected_bool_draws_no_noise(self):
+        """A refused bool node type leaves the seeded noise stream where it was."""
+        for cls in (FiveGDistributedSimulator, Simu5GAdapter, NetworkSimulator):
+            a, b = cls(seed=3), cls(seed=3)
+            with pytest.raises(TypeError):
+                a.simulate_latency(True, "IoT", task_size_mb=1.0, node_load=0.0)
+            assert a.simulate_latency("edge", "IoT", 1.0, 0.0) == b.simulate_latency("edge", "IoT", 1.0, 0.0)
+
+    def test_seed_makes_scalar_path_reproducible(self):
+        """Two simulators with the same seed produce the same latencies."""
+        a = FiveGDistributedSimulator(seed=5)
+        b = FiveGDistributedSimulator(seed=5)
+        for node in ("edge", "cloud", "edge"):
+            assert a.latency_ms(node, 0.3, 2.0) == b.latency_ms(node, 0.3, 2.0)
+
     def test_load_affects_latency(self):
         """Test that higher load increases latency."""
         sim = FiveGDistributedSimulator()
@@ -89,6 +126,7 @@ class TestSimu5GAdapter:
         """Test Simu5GAdapter can be initialized."""
         sim = Simu5GAdapter()
         assert sim.endpoint == "localhost:5555"
+        assert sim.simulate_delay is False  # emulated round trips are opt-in
     
     def test_simulate_latency_override(self):
         """Test that simulate_latency is properly overridden."""
@@ -97,6 +135,38 @@ class TestSimu5GAdapter:
         assert latency > 0
         assert latency < 1.0  # Should be in seconds
 
+    def test_seeded_scalar_draws_leave_global_random_alone(self):
+        """Seeded adapters repeat their draws without reseeding the random module."""
+        import random
+        state = random.getstate()
+        a = Simu5GAdapter(simulate_delay=False, seed=11)
+        b = Simu5GAdapter(simulate_delay=False, seed=11)
+        assert [a.latency_ms("cloud", 0.2, 1.0) for _ in range(5)] == [b.latency_ms("cloud", 0.2, 1.0) for _ in range(5)]
+        assert random.getstate() == state
+
+    def test_scalar_delay_is_amortized(self):
+        """Per-call round trips are slept off in a few larger sleeps."""
+        sleeps = []
+
+        class FakeTime:
+            def time(self):
+                return 0.0
+
+            def sleep(self, seconds):
+                sleeps.append(seconds)
+
+        sim = Simu5GAdapter(simulate_delay=True)
+        sim._time = FakeTime()
+        for _ in range(50):
+            sim.latency_ms("edge", 0.1, 1.0)
+        assert len(sleeps) == 2
+        sim.flush_delay()  # the remainder below one flush chunk is still slept
+        assert len(sleeps) == 3
+        assert sum(sleeps) == pytest.approx(50 * 0.0005)
+        sim.latency_ms("edge", 0.1, 1.0)
+        sim.latency_ms_batch(np.array([True, False]), np.zeros(2), np.ones(2))
+        assert sum(sleeps) == pytest.approx(52 * 0.0005)
+
 
 class TestSimulatorFactory:
     """Test simulator factory function."""
@@ -149,3 +219,70 @@ class TestNodeWithSimulator:
         # Latency should be higher with load
         assert latency2 > latency1
 
+
+
+class TestSimulateLatencyBatch:
+    """Test batched latency simulation."""
+    
+    def test_base_batch_uses_scalar_model(self):
+        """Generic batch path returns one latency per task in the scalar model's range."""
+        sim = NetworkSimulator()
+        lat = sim.simulate_latency_batch(np.array([True, False]), np.array([1.0, 1.0]), np.zeros(2), ["IoT", "IoT"])
+        assert lat.shape == (2,)
+        assert 0.002 < lat[0] < 0.0025
+        assert 0.008 < lat[1] < 0.0085
+    
+    def test_fiveg_batch_load_increases_latency(self):
+        """Higher load raises batched edge latency, as in the scalar model."""
+        sim = FiveGDistributedSimulator(fading_variance=0.0, interference_prob=0.0)
+        is_edge = np.ones(2, dtype=bool)
+        lat = sim.simulate_latency_batch(is_edge, np.array([1.0, 1.0]), np.array([0.0, 50.0]))
+        assert lat[1] > lat[0]
+        assert abs(lat[0] - sim.simulate_latency("edge", "IoT", task_size_mb=1.0, node_load=0.0)) < 1e-9
+    
+    def test_batch_accepts_flags_and_names(self):
+        """Flag and name arrays give the same edge/cloud split as a boolean mask."""
+        sim = FiveGDistributedSimulator(fading_variance=0.0, interference_prob=0.0)
+        expected = sim.latency_ms_batch(np.array([True, False]), np.zeros(2), np.ones(2))
+        for node_types in (np.array([NODE_EDGE, NODE_CLOUD]), np.array(["Edge", "cloud"])):
+            lat = sim.latency_ms_batch(node_types, np.zeros(2), np.ones(2))
+            assert lat[0] == expected[0]
+            assert lat[1] > lat[0] + 10.0
+
+    def test_simu5g_batch_range(self):
+        """Simu5G batch latencies stay within the scalar model's bounds."""
+        sim = Simu5GAdapter(simulate_delay=False)
+        is_edge = np.array([True, False] * 50)
+        lat_ms = sim.simulate_latency_batch(is_edge, np.full(100, 4.0), np.zeros(100)) * 1000.0
+        assert (lat_ms[is_edge] >= 4.5 - 1.5).all() and (lat_ms[is_edge] <= 4.5 + 1.5 + 1.0 + 1e-9).all()
+        assert (lat_ms[~is_edge] >= 22.0 + 10.0 - 1.5).all()
+    
+    def test_base_batch_app_jitter(self):
+        """Vectorised base batch applies each app's jitter range."""
+        sim = NetworkSimulator()
+        apps = ["IoT", "ARVR", "VANET", "other"] * 50
+        lat = sim.simulate_latency_batch(np.ones(200, dtype=bool), np.ones(200), np.zeros(200), apps)
+        jitter = (lat - 0.002).reshape(50, 4)
+        assert ((jitter[:, 0] >= 0.0001) & (jitter[:, 0] <= 0.0005)).all()
+        assert ((jitter[:, 1] >= 0.001) & (jitter[:, 1] <= 0.002)).all()
+        assert ((jitter[:, 2] >= 0.0005) & (jitter[:, 2] <= 0.001)).all()
+        assert ((jitter[:, 3] >= 0.0001) & (jitter[:, 3] <= 0.001)).all()
+    
+    def test_subclass_scalar_override_is_used(self):
+        """Subclasses overriding only simulate_latency keep the per-task path."""
+        class ConstantSim(NetworkSimulator):
+            def simulate_latency(self, node_type, app_type, task_size_mb=1.0, node_load=0.0):
+                return 0.5 if node_type == "edge" else 1.5
+        lat = ConstantSim().simulate_latency_batch(np.array([True, False]), np.ones(2), np.zeros(2))
+        assert lat.tolist() == [0.5, 1.5]
+
+    def test_basic_signature_override_is_used(self):
+        """Two-argument simulate_latency overrides work through the batch path."""
+        from orchestrator.environment import execute_placements
+        class BasicSim(NetworkSimulator):
+            def simulate_latency(self, node_type, app_type):
+                return 0.5 if node_type == "edge" else 1.5
+        edge, cloud = Node(0, "edge", 2.0), Node(1, "cloud", 8.0)
+        lat, _ = execute_placements(edge, cloud, [1.0, 2.0], [True, False], ["IoT", "IoT"], network_sim=BasicSim())
+        assert lat.tolist() == [1.0 / 2.0 * 1000.0 + 500.0, 2.0 / 8.0 * 1000.0 + 1500.0]
+
@@ -0,0 +1,66 @@
+"""
+Tests for WorkloadGenerator.
+"""
+import pandas as pd
+from orchestrator.workload_generator import WorkloadGenerator
+
+
+class TestWorkloadGenerator:
+    """Test workload generation output."""
+    
+    def test_generate_with_timestamps(self, tmp_path):
+        """Generated tasks respect per-app size ranges and arrive in order."""
+        gen = WorkloadGenerator(num_tasks=500, poisson_lambda=3.0, random_seed=7, out_dir=str(tmp_path))
+        df = pd.read_csv(gen.generate())
+        
+        assert list(df.columns) == ["task_id", "timestamp", "app_type", "size_mb", "priority"]
+        assert len(df) == 500
+        assert df["task_id"].tolist() == list(range(500))
+        assert pd.to_datetime(df["timestamp"]).is_monotonic_increasing
+        for app, profile in gen.app_profiles.items():
+            sizes = df.loc[df["app_type"] == app, "size_mb"]
+            lo, hi = profile["size_range"]
+            assert sizes.between(lo, hi).all()
+        assert set(df["priority"]) <= {"low", "medium", "high"}
+    
+    def test_generate_without_timestamps(self, tmp_path):
+        """Without poisson_lambda the timestamp column is omitted."""
+        gen = WorkloadGenerator(num_tasks=10, out_dir=str(tmp_path))
+        df = pd.read_csv(gen.generate())
+        assert list(df.columns) == ["task_id", "app_type", "size_mb", "priority"]
+    
+    def test_tz_aware_base_time_keeps_wall_clock(self, tmp_path):
+        """A tz-aware base_time is written in its own local time, not converted to UTC."""
+        import warnings
+        from datetime import datetime, timedelta, timezone
+        base = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone(timedelta(hours=5)))
+        gen = WorkloadGenerator(num_tasks=5, base_time=base, poisson_lambda=1000.0, random_seed=1, out_dir=str(tmp_path))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            df = pd.read_csv(gen.generate())
+        assert df["timestamp"].str.startswith("2024-01-01 12:00:").all()
+    
+    def test_seed_is_reproducible(self, tmp_path):
+        """The same seed yields the same task columns."""
+        a = WorkloadGenerator(num_tasks=50, random_seed=3, out_dir=str(tmp_path / "a"))
+        b = WorkloadGenerator(num_tasks=50, random_seed=3, out_dir=str(tmp_path / "b"))
+        assert open(a.generate()).read() == open(b.generate()).read()
+
+
+class TestLegacyWorkloadGenerator:
+    """Test the legacy timestamped generator in generate_workloads."""
+    
+    def test_generate_columns(self, tmp_path):
+        """Batched columns stay in range, arrive in order and follow the seed."""
+        from orchestrator.generate_workloads import WorkloadGenerator as LegacyGenerator
+        gen = LegacyGenerator(num_tasks=300, random_seed=5, out_dir=str(tmp_path / "a"))
+        path = gen.generate()
+        df = pd.read_csv(path)
+        
+        assert df["task_id"].tolist() == list(range(300))
+        assert pd.to_datetime(df["timestamp"]).is_monotonic_increasing
+        for app, profile in gen.app_profiles.items():
+            lo, hi = profile["size_range"]
+            assert df.loc[df["app_type"] == app, "size_mb"].between(lo, hi).all()
+        again = LegacyGenerator(num_tasks=300, random_seed=5, base_time=gen.base_time, out_dir=str(tmp_path / "b"))
+        assert open(again.generate()).read() == open(path).read()
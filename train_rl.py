@@ -4,9 +4,12 @@ from orchestrator.rl_orchestrator import RLBasedOrchestrator
 from orchestrator.sim_interface import get_simulator
 import numpy as np
 
+# Same default as config.DATA_DIR; exp_cli gives concurrent trials their own
+DATA_DIR = os.getenv("DATA_DIR", "data")
+
 def ensure_dirs():
     """Ensures the data directory exists."""
-    os.makedirs("data", exist_ok=True)
+    os.makedirs(DATA_DIR, exist_ok=True)
 
 def train_and_eval(episodes: int = 1000, sim_type: str = "simple"):
     """
@@ -31,6 +34,10 @@ def train_and_eval(episodes: int = 1000, sim_type: str = "simple"):
     
     # Use specified simulator
     sim = get_simulator(sim_type)
+    if getattr(sim, "simulate_delay", False):
+        # The emulated Simu5G round trip only costs wall-clock time; training
+        # sees the same latencies without it
+        sim.simulate_delay = False
     
     # Initialize Agent
     # Increased episodes for better convergence on new policy
@@ -38,12 +45,11 @@ def train_and_eval(episodes: int = 1000, sim_type: str = "simple"):
     orch.set_simulator(sim)
     
     # Train
-    latencies, rewards = orch.simulate_environment(num_tasks=300)
+    avg_latency, rewards = orch.simulate_environment(num_tasks=300)
     
     # Save Weights
-    orch.save_weights("data/rl_weights.npy")
+    orch.save_weights(os.path.join(DATA_DIR, "rl_weights.npy"))
     
-    avg_latency = np.mean(latencies) if latencies else 0.0
     print(f"Training Complete. Final Avg Reward: {np.mean(rewards[-50:]):.4f}")
     
     return avg_latency
@@ -0,0 +1,46 @@
+# utils/aws.py
+"""
+Shared boto3 session and clients.
+
+Building a boto3 client is slow (endpoint data, service model, signer), so
+every module gets its clients from here: one Session per process and one
+client per (service, region).
+"""
+import functools
+import threading
+
+import boto3
+
+_lock = threading.Lock()  # boto3 Sessions are not thread-safe; clients are
+_session = None
+
+
+def get_session() -> boto3.session.Session:
+    """Return the process-wide boto3 Session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = boto3.session.Session()
+    return _session
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(service: str, region: str):
+    """Return the shared client for `service` in `region`."""
+    session = get_session()
+    with _lock:
+        return session.client(service, region_name=region)
+
+
+@functools.lru_cache(maxsize=1)
+def has_credentials() -> bool:
+    """
+    True if the default credential chain finds any credentials. Checked
+    locally, without an API call; invalid credentials only show up on the
+    first real request.
+    """
+    try:
+        return get_session().get_credentials() is not None
+    except Exception:
+        return False
@@ -3,7 +3,9 @@ CloudWatch logging and metrics utility for the orchestrator project.
 Supports both log streaming and custom metrics publishing.
 """
 
-import boto3
+import atexit
+import queue
+import threading
 import time
 import os
 from typing import Optional
@@ -17,6 +19,8 @@ except ImportError:
     ClientError = Exception
     NoCredentialsError = Exception
 
+from utils.aws import get_client, has_credentials
+
 # Import safe print utility
 try:
     from utils.console import safe_print
@@ -31,6 +35,83 @@ except ImportError:
                 print(msg.encode('ascii', 'replace').decode('ascii'))
 
 
+# ---------------------------------------------------------------------
+# Background dispatch: log() and put_metric() only enqueue; one daemon
+# worker batches the queued entries into PutLogEvents/PutMetricData calls
+# ---------------------------------------------------------------------
+_LOG_BATCH_EVENTS = 10000         # PutLogEvents limits: events per call ...
+_LOG_BATCH_BYTES = 1048576        # ... and bytes per call,
+_LOG_EVENT_OVERHEAD = 26          # counting 26 bytes per event
+_METRIC_BATCH_SIZE = 20           # PutMetricData accepts at most 20 MetricData entries per call
+_DISPATCH_INTERVAL_S = 1.0        # longest an entry waits before it is sent
+
+_cw_queue: queue.Queue = queue.Queue(maxsize=10000)
+_flush_requested = threading.Event()
+_worker_lock = threading.Lock()
+_worker_thread: Optional[threading.Thread] = None
+
+
+def _worker():
+    """Drain the queue, handing each sink its entries in one _send call."""
+    while True:
+        first = _cw_queue.get()
+        # Let more entries arrive before sending, unless a flush is waiting
+        _flush_requested.wait(_DISPATCH_INTERVAL_S)
+        items = [first]
+        while True:
+            try:
+                items.append(_cw_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        batches: dict = {}
+        for sink, entry in items:
+            batches.setdefault(sink, []).append(entry)
+        for sink, entries in batches.items():
+            try:
+                sink._send(entries)
+            except Exception:
+                pass  # a failed batch must not stop the worker
+        for _ in items:
+            _cw_queue.task_done()
+
+
+def _enqueue(sink, entry) -> None:
+    """Queue an entry for the worker, starting it on first use; drops the entry if the queue is full."""
+    global _worker_thread
+    if _worker_thread is None:
+        with _worker_lock:
+            if _worker_thread is None:
+                _worker_thread = threading.Thread(target=_worker, name="cloudwatch-dispatch", daemon=True)
+                _worker_thread.start()
+    try:
+        _cw_queue.put_nowait((sink, entry))
+    except queue.Full:
+        pass  # never block the caller on CloudWatch
+
+
+def flush_and_join(timeout: float = 5.0) -> bool:
+    """
+    Send everything queued so far and wait for it, up to `timeout` seconds.
+    Returns False if entries were still pending when the timeout ran out.
+    """
+    deadline = time.monotonic() + timeout
+    _flush_requested.set()
+    try:
+        with _cw_queue.all_tasks_done:
+            while _cw_queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                _cw_queue.all_tasks_done.wait(remaining)
+        return True
+    finally:
+        _flush_requested.clear()
+
+
+atexit.register(flush_and_join)
+
+
 class CloudWatchLogger:
     """
     CloudWatch Logs logger for streaming application logs.
@@ -57,38 +138,36 @@ class CloudWatchLogger:
         self.enabled = False
         self._error_shown = False  # Track if we've already shown the error message
         
-        # Try to initialize boto3 client (will fail gracefully if AWS credentials not available)
-        try:
-            self.client = boto3.client("logs", region_name=self.region)
-            # Test credentials by trying to describe log groups (lightweight operation)
-            try:
-                self.client.describe_log_groups(logGroupNamePrefix=self.log_group, limit=1)
-                self._ensure_log_group()
-                self._ensure_log_stream()
-                self.enabled = True
-                safe_print(
-                    f"[OK] CloudWatch logging enabled -> {self.log_group}/{self.log_stream}",
-                    fallback=f"[OK] CloudWatch logging enabled -> {self.log_group}/{self.log_stream}"
-                )
-            except Exception as e:
-                # Credentials invalid - disable silently
-                self.client = None
-                self.enabled = False
-                if not self._error_shown:
-                    safe_print(
-                        f"[INFO] CloudWatch logging disabled (local mode - invalid AWS credentials)",
-                        fallback=f"[INFO] CloudWatch logging disabled (local mode - invalid AWS credentials)"
-                    )
-                    self._error_shown = True
-        except Exception as e:
+        if not has_credentials():
             # Not an error - just means we're running locally without AWS credentials
+            safe_print(
+                f"[INFO] CloudWatch logging disabled (local mode - no AWS credentials)",
+                fallback=f"[INFO] CloudWatch logging disabled (local mode - no AWS credentials)"
+            )
+            self._error_shown = True
+            return
+
+        # Credentials are checked locally above; bad ones surface (and disable
+        # logging) on the first create/put call instead of a separate probe
+        try:
+            self.client = get_client("logs", self.region)
+            self.enabled = True
+            self._ensure_log_group()
+            self._ensure_log_stream()
+        except Exception:
+            self.client = None
             self.enabled = False
-            if not self._error_shown:
-                safe_print(
-                    f"[INFO] CloudWatch logging disabled (local mode - no AWS credentials)",
-                    fallback=f"[INFO] CloudWatch logging disabled (local mode - no AWS credentials)"
-                )
-                self._error_shown = True
+        if self.enabled:
+            safe_print(
+                f"[OK] CloudWatch logging enabled -> {self.log_group}/{self.log_stream}",
+                fallback=f"[OK] CloudWatch logging enabled -> {self.log_group}/{self.log_stream}"
+            )
+        elif not self._error_shown:
+            safe_print(
+                f"[INFO] CloudWatch logging disabled (local mode - invalid AWS credentials)",
+                fallback=f"[INFO] CloudWatch logging disabled (local mode - invalid AWS credentials)"
+            )
+            self._error_shown = True
 
     def _ensure_log_group(self):
         """Create log group if it doesn't exist."""
@@ -168,18 +247,35 @@ class CloudWatchLogger:
         if not self.enabled or not self.client:
             return  # Silently skip if not enabled (local mode)
         
-        timestamp = int(time.time() * 1000)
-        formatted_message = f"[{level}] {message}"
-        
+        _enqueue(self, {
+            "timestamp": int(time.time() * 1000),
+            "message": f"[{level}] {message}"
+        })
+
+    def _send(self, events: list):
+        """Send queued log events in as few PutLogEvents calls as the limits allow."""
+        if not self.enabled or not self.client:
+            return
+
+        batch, batch_bytes = [], 0
+        for event in events:
+            size = len(event["message"].encode("utf-8")) + _LOG_EVENT_OVERHEAD
+            if batch and (len(batch) >= _LOG_BATCH_EVENTS or batch_bytes + size > _LOG_BATCH_BYTES):
+                self._put_log_events(batch)
+                batch, batch_bytes = [], 0
+            batch.append(event)
+            batch_bytes += size
+        if batch:
+            self._put_log_events(batch)
+
+    def _put_log_events(self, events: list):
+        if not self.enabled or not self.client:
+            return
+
         params = {
             "logGroupName": self.log_group,
             "logStreamName": self.log_stream,
-            "logEvents": [
-                {
-                    "timestamp": timestamp,
-                    "message": formatted_message
-                }
-            ]
+            "logEvents": events
         }
 
         if self.sequence_token:
@@ -217,6 +313,7 @@ class CloudWatchLogger:
 class CloudWatchMetrics:
     """
     CloudWatch Metrics publisher for custom metrics.
+    Metrics are sent in batches from a background thread; call flush() to wait for them.
     """
     
     def __init__(self, namespace: str = "LatencyOrchestrator", region: Optional[str] = None):
@@ -233,30 +330,22 @@ class CloudWatchMetrics:
         self.enabled = False
         self._error_shown = False  # Track if we've already shown the error message
         
+        if not has_credentials():
+            safe_print(
+                f"[INFO] CloudWatch metrics disabled (local mode - no AWS credentials)",
+                fallback=f"[INFO] CloudWatch metrics disabled (local mode - no AWS credentials)"
+            )
+            self._error_shown = True
+            return
+
+        # No list_metrics probe: invalid credentials disable publishing on the
+        # first PutMetricData call
         try:
-            self.client = boto3.client("cloudwatch", region_name=self.region)
-            # Test credentials by trying to list metrics (lightweight operation)
-            try:
-                self.client.list_metrics(Namespace=self.namespace, MaxRecords=1)
-                self.enabled = True
-            except Exception as e:
-                # Credentials invalid - disable silently
-                self.client = None
-                self.enabled = False
-                if not self._error_shown:
-                    safe_print(
-                        f"[INFO] CloudWatch metrics disabled (local mode - invalid AWS credentials)",
-                        fallback=f"[INFO] CloudWatch metrics disabled (local mode - invalid AWS credentials)"
-                    )
-                    self._error_shown = True
-        except Exception as e:
+            self.client = get_client("cloudwatch", self.region)
+            self.enabled = True
+        except Exception:
+            self.client = None
             self.enabled = False
-            if not self._error_shown:
-                safe_print(
-                    f"[INFO] CloudWatch metrics disabled (local mode - no AWS credentials)",
-                    fallback=f"[INFO] CloudWatch metrics disabled (local mode - no AWS credentials)"
-                )
-                self._error_shown = True
 
     def put_metric(
         self,
@@ -289,11 +378,23 @@ class CloudWatchMetrics:
                 {"Name": k, "Value": str(v)} for k, v in dimensions.items()
             ]
         
+        _enqueue(self, metric_data)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every queued metric (and log event) has been sent."""
+        return flush_and_join(timeout)
+
+    def _send(self, metric_data: list):
+        """Send queued metrics, up to 20 per PutMetricData call."""
+        if not self.enabled or not self.client:
+            return
+
         try:
-            self.client.put_metric_data(
-                Namespace=self.namespace,
-                MetricData=[metric_data]
-            )
+            for i in range(0, len(metric_data), _METRIC_BATCH_SIZE):
+                self.client.put_metric_data(
+                    Namespace=self.namespace,
+                    MetricData=metric_data[i:i + _METRIC_BATCH_SIZE]
+                )
         except Exception as e:
             # Disable on credential errors and suppress repeated warnings
             error_str = str(e).lower()
@@ -8,7 +8,7 @@ def safe_print(message: str, fallback: str | None = None) -> None:
     """ 
     Args:
         message: Message to print (may contain Unicode characters)
-        fallback: Fallback message if encoding fails (default: strip emojis)
+        fallback: Fallback message if encoding fails (default: replace unencodable characters)
     """
     try:
         print(message)
@@ -16,21 +16,9 @@ def safe_print(message: str, fallback: str | None = None) -> None:
         if fallback:
             print(fallback)
         else:
-            # Remove common emoji characters
-            fallback_msg = message
-            emoji_replacements = {
-                '[OK]': '[OK]',
-                '[WARN]': '[WARN]',
-                '[START]': '[START]',
-                '[UPLOAD]': '[UPLOAD]',
-                '[SAVE]': '[SAVE]',
-                '[LOAD]': '[LOAD]',
-                '-\u003e': '-\u003e',
-                '[CONFIG]': '[CONFIG]',
-            }
-            for emoji, replacement in emoji_replacements.items():
-                fallback_msg = fallback_msg.replace(emoji, replacement)
-            print(fallback_msg)
+            # Replace whatever the console cannot encode, in one pass
+            encoding = getattr(sys.stdout, "encoding", None) or "ascii"
+            print(message.encode(encoding, "replace").decode(encoding))
 
 
 def setup_console_encoding():
@@ -1,9 +1,8 @@
 # utils/s3_io.py
-import boto3, os
+import os
 from botocore.exceptions import ClientError
 from config import AWS_REGION, S3_BUCKET, RUN_ID
-
-s3 = boto3.client("s3", region_name=AWS_REGION)
+from utils.aws import get_client
 
 def _prefix():
     # Folder per run
@@ -16,7 +15,7 @@ def upload_file(local_path: str, key_prefix: str | None = None) -> str:
     prefix = key_prefix or _prefix()
     key = f"{prefix}/{os.path.basename(local_path)}"
     try:
-        s3.upload_file(local_path, S3_BUCKET, key)
+        get_client("s3", AWS_REGION).upload_file(local_path, S3_BUCKET, key)
         url = f"s3://{S3_BUCKET}/{key}"
         print(f"[OK] Uploaded -> {url}")
         return url